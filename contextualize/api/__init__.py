@@ -3,6 +3,7 @@
 from sanic import Sanic
 
 from contextualize.api.community import bp as community
+from contextualize.extraction.extractor import BaseExtractor
 from contextualize.utils.cache import AsyncCache
 
 APPLICATION = 'contextualize'
@@ -19,3 +20,8 @@ async def initialize_cache(app, loop):
 @app.listener('after_server_stop')
 async def terminate_cache(app, loop):
     await app.cache.disconnect()
+
+
+@app.listener('after_server_stop')
+async def terminate_web_drivers(app, loop):
+    await BaseExtractor.web_driver_pool.close(loop=loop)
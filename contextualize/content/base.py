@@ -6,10 +6,11 @@ from dataclasses import dataclass, fields as dataclass_fields
 from functools import lru_cache
 from itertools import chain
 
+from contextualize.utils import tools
 from contextualize.utils.enum import FlexEnum
 from contextualize.utils.serialization import NULL, serialize_nonstandard, serialize
 from contextualize.utils.time import GranularDateTime
-from contextualize.utils.tools import PP, load_class, represent
+from contextualize.utils.tools import load_class, represent
 
 
 class FieldMixin:
@@ -43,7 +44,7 @@ class FieldMixin:
         return represent(self, **self.as_dict(include_private=True))
 
     def __str__(self):
-        return PP.pformat(self.as_dict(include_private=True))
+        return tools.PP.pformat(self.as_dict(include_private=True))
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
@@ -95,23 +96,28 @@ class Hashable(FieldMixin):
             field_data = ((k.decode(encoding), v.decode(encoding)) for k, v in field_data)
 
         field_hash = dict(field_data)
-        init_kwds = OrderedDict()
+        init_kwds = {}
 
-        for field in cls.field_names(include_private=True):
+        for field, custom_method in cls.field_deserializers():
             if field in field_hash:
                 value = field_hash[field]
                 if value == NULL or value is None:
                     init_kwds[field] = None
-                    continue
-                custom_method_name = f'{cls.DESERIALIZE_METHOD_PREFIX}{field}'
-                if hasattr(cls, custom_method_name):
-                    custom_method = getattr(cls, custom_method_name)
+                elif custom_method:
                     init_kwds[field] = custom_method(value, **field_hash)
                 else:
                     init_kwds[field] = value
 
         return cls(**init_kwds)
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def field_deserializers(cls):
+        """Return tuple of field name/custom deserializer (or None) pairs"""
+        prefix = cls.DESERIALIZE_METHOD_PREFIX
+        return tuple((name, getattr(cls, f'{prefix}{name}', None))
+                     for name in cls.field_names(include_private=True))
+
     def to_hash(self, encoding=None):
         """Convert to ordered dict, optionally encoding as well"""
         cls = self.__class__
@@ -120,9 +126,17 @@ class Hashable(FieldMixin):
                       if v is not None)
         serialized = chain(model_data, field_data)
         if encoding:
-            serialized = ((k.encode(encoding), v.encode(encoding)) for k, v in serialized)
+            encoded_names = cls.encoded_field_names(encoding)
+            serialized = ((encoded_names[k], v.encode(encoding)) for k, v in serialized)
         return OrderedDict(serialized)
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def encoded_field_names(cls, encoding):
+        """Return map of hash field names (model key included) to encoded names"""
+        names = chain((cls.MODEL_KEY,), cls.field_names(include_private=True))
+        return {name: name.encode(encoding) for name in names}
+
     def to_json(self, encoding=None):
         """Convert object to JSON, optionally encoding as well"""
         od = self.as_dict(include_private=True)
@@ -144,7 +158,7 @@ class Hashable(FieldMixin):
         return FlexEnum.deserialize(enum_specifier)
 
     def __str__(self):
-        return PP.pformat(self.to_hash())
+        return tools.PP.pformat(self.to_hash())
 
 
 @dataclass
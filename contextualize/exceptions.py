@@ -8,13 +8,19 @@ logger = logging.getLogger(__name__)
 class ErrorDocstringMixin:
     """Mixin allowing custom exceptions to be defined via docstrings"""
 
+    def __init_subclass__(cls, **kwds):
+        """Normalize docstring whitespace once to serve as template"""
+        super().__init_subclass__(**kwds)
+        if cls.__doc__:
+            cls._docstring_template = ' '.join(cls.__doc__.split())
+
     def __init__(self, message=None, *args, **kwds):
-        template = message if message else ' '.join(self.__doc__.split())
+        template = message if message else self._docstring_template
         message = template.format(**kwds) if kwds else (
             template.format(*args) if args else template)
         message = message.strip('\"\'')
         logger.debug(message)
-        super().__init__(self, message)
+        super().__init__(message)
 
 
 class BaseCustomError(ErrorDocstringMixin, Exception):
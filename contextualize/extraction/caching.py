@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 import asyncio
 import datetime
-from collections import OrderedDict
+import time
 
 from contextualize.content.base import Hashable
 from contextualize.extraction.definitions import ExtractionStatus
@@ -15,8 +15,13 @@ ENCODING_DEFAULT = 'utf-8'
 
 class BaseContentCache:
 
+    __slots__ = ('core', 'cache_version')
+
     CONTENT_KEY = 'content'
     RANK_KEY = 'rank'
+    ENCODED_RANK_KEY = RANK_KEY.encode(ENCODING_DEFAULT)
+    # Content key up to the source URL value, formed once via CacheKey
+    CONTENT_KEY_PREFIX = CacheKey(CONTENT_KEY, source_url='').key
 
     @property
     def client(self):
@@ -26,41 +31,48 @@ class BaseContentCache:
         """Prepare content for storage and return hash"""
         content.cache_version = self.cache_version
         content.last_extracted = datetime.datetime.utcnow()
-        content_hash = content.to_hash()
+        # Encode up front so the client passes fields through as bytes
+        content_hash = content.to_hash(encoding=ENCODING_DEFAULT)
         # Ranks are sorted set scores as they can vary with each search
-        content_hash.pop(self.RANK_KEY, None)
+        content_hash.pop(self.ENCODED_RANK_KEY, None)
         return content_hash
 
     def _form_content_key(self, source_url):
+        if isinstance(source_url, str):
+            return self.CONTENT_KEY_PREFIX + source_url
         return CacheKey(self.CONTENT_KEY, source_url=source_url).key
 
     def __init__(self, cache_version=None, loop=None):
-        self.loop = loop or asyncio.get_event_loop()
-        self.core = AsyncCache(self.loop)
+        # AsyncCache is a singleton, so all caches share one pooled client
+        # bound to its loop; a loop need only be given if not yet created
+        self.core = AsyncCache(loop) if loop else AsyncCache()
         self.cache_version = cache_version
 
 
 class SourceExtractorCache(BaseContentCache):
 
+    __slots__ = ('source_url', 'content_key')
+
     async def store_content_item(self, content):
         """Store content item in cache"""
-        content_key = self._form_content_key(self.source_url)
         content_hash = self._prepare_content(content)
-        return await self.client.hmset_dict(content_key, content_hash)
+        return await self.client.hmset_dict(self.content_key, content_hash)
 
     async def retrieve_content_item(self):
         """Retrieve cached content item from cache"""
-        content_key = self._form_content_key(self.source_url)
-        content_hash = await self.client.hgetall(content_key)
+        content_hash = await self.client.hgetall(self.content_key)
         return Hashable.from_hash(content_hash) if content_hash else None
 
     def __init__(self, source_url, cache_version, loop=None):
         super().__init__(cache_version=cache_version, loop=loop)
         self.source_url = source_url
+        self.content_key = self._form_content_key(self.source_url)
 
 
 class ContentCache(BaseContentCache):
 
+    __slots__ = ('search_data', '_ranked_content_keys', 'search_results_key')
+
     # Cache keys
     EXTRACTION_KEY = 'extraction'
     INFO_KEY = 'info'
@@ -74,15 +86,34 @@ class ContentCache(BaseContentCache):
 
     async def retrieve_search_results(self):
         """Retrieve all cached content hashes for the search data"""
+        # Read a snapshot as results may be stored while extraction continues
         return await self.retrieve_ranked_content_hashes(self.search_results_key)
 
     async def retrieve_ranked_content_hashes(self, results_key):
-        """Retrieve list of cached content hashes for given results key"""
-        key_rank_tuples = await self.client.zrange(results_key, withscores=True)
+        """
+        Retrieve ranked content hashes
+
+        Retrieve list of cached content hashes for given results key.
+        If the content keys for the results key have been retrieved
+        before, their hashes are requested alongside the ranked keys in
+        a single round-trip, only re-requesting them if keys changed.
+        """
+        known_keys = self._ranked_content_keys.get(results_key)
+        pipe = self.client.pipeline()
+        pipe.zrange(results_key, withscores=True)
+        for key in known_keys or ():
+            pipe.hgetall(key)
+        key_rank_tuples, *content_hashes = await pipe.execute()
+
         if not key_rank_tuples:
+            self._ranked_content_keys.pop(results_key, None)
             return []
+
         keys, ranks = zip(*key_rank_tuples)
-        content_hashes = await self.retrieve_content_hashes(keys)
+        self._ranked_content_keys[results_key] = keys
+        if keys != known_keys:
+            content_hashes = await self.retrieve_content_hashes(keys)
+
         for content_hash, rank in zip(content_hashes, ranks):
             content_hash[self.RANK_KEY] = rank
         return content_hashes
@@ -90,24 +121,25 @@ class ContentCache(BaseContentCache):
     async def retrieve_content_hashes(self, content_keys):
         """Retrieve cached content hashes for given content keys"""
         pipe = self.client.pipeline()
-        cached_content = [pipe.hgetall(key) for key in content_keys]
-        await pipe.execute()
-        return await asyncio.gather(*cached_content)
+        for key in content_keys:
+            pipe.hgetall(key)
+        return await pipe.execute()
 
     async def retrieve_content_map(self, results_key):
-        """Retrieve ordered dict of content items keyed by source URL"""
+        """Retrieve rank-ordered dict of content items keyed by source URL"""
         content_hashes = await self.retrieve_ranked_content_hashes(results_key)
-        return OrderedDict((content_hash[self.SOURCE_URL_KEY], Hashable.from_hash(content_hash))
-                           for content_hash in content_hashes)
+        source_url_key = self.SOURCE_URL_KEY
+        return {content_hash[source_url_key]: Hashable.from_hash(content_hash)
+                for content_hash in content_hashes}
 
     async def retrieve_extraction_info_map(self, directories):
         """Retrieve map of extraction info by extractor directory"""
         pipe = self.client.pipeline()
         extraction_info_keys = (self._form_extraction_info_key(directory, **self.search_data)
                                 for directory in directories)
-        cached_info_futures = [pipe.hgetall(key) for key in extraction_info_keys]
-        await pipe.execute()
-        info_hashes = await asyncio.gather(*cached_info_futures)
+        for key in extraction_info_keys:
+            pipe.hgetall(key)
+        info_hashes = await pipe.execute()
         info_items = (ExtractionInfo.from_hash(info_hash) for info_hash in info_hashes)
         return {directory: info for directory, info in zip(directories, info_items)}
 
@@ -120,11 +152,19 @@ class ContentCache(BaseContentCache):
     def __init__(self, search_data, cache_version=None, loop=None):
         super().__init__(cache_version=cache_version, loop=loop)
         self.search_data = search_data
+        self._ranked_content_keys = {}  # content keys by results key, from last retrieval
         self.search_results_key = self._form_search_results_key(**self.search_data)
 
 
 class MultiExtractorCache(ContentCache):
 
+    __slots__ = ('directory', 'extraction_info_key', 'extraction_results_key',
+                 '_recent_info', '_info_read')
+
+    # Extractors read their info in quick succession, so reads are reused
+    # briefly; writes by other processes may go unseen for up to the TTL
+    INFO_CACHE_TTL = 0.1  # seconds
+
     async def store_extraction_info(self, status):
         """
         Store extraction info
@@ -136,6 +176,15 @@ class MultiExtractorCache(ContentCache):
                 last_extracted: '2019-04-20T23:52:11.810493',
             }
         """
+        info_hash = self._prepare_extraction_info(status)
+        self._invalidate_extraction_info()
+        try:
+            return await self.client.hmset_dict(self.extraction_info_key, info_hash)
+        finally:
+            self._invalidate_extraction_info()
+
+    def _prepare_extraction_info(self, status):
+        """Prepare extraction info for storage and return hash"""
         info_hash = {}
         info_hash[self.STATUS_KEY] = status.name
 
@@ -145,29 +194,60 @@ class MultiExtractorCache(ContentCache):
         if self.cache_version:
             info_hash[self.CACHE_VERSION_KEY] = self.cache_version
 
-        return await self.client.hmset_dict(self.extraction_info_key, info_hash)
+        return info_hash
 
     async def retrieve_extraction_info(self):
-        """Retrieve extraction info from cache"""
-        info_hash = await self.client.hgetall(self.extraction_info_key)
-        return ExtractionInfo.from_hash(info_hash)
+        """Retrieve extraction info from cache, reusing recent reads"""
+        recent_info = self._recent_info
+        if recent_info and recent_info[0] > time.monotonic():
+            return recent_info[1]
+        # Concurrent callers share a single in-flight read
+        if self._info_read is None:
+            self._info_read = asyncio.ensure_future(self._read_extraction_info())
+        return await asyncio.shield(self._info_read)
+
+    async def _read_extraction_info(self):
+        info_read = asyncio.current_task()
+        try:
+            info_hash = await self.client.hgetall(self.extraction_info_key)
+            info = ExtractionInfo.from_hash(info_hash)
+            # Reads overtaken by a write are not reused
+            if self._info_read is info_read:
+                self._recent_info = (time.monotonic() + self.INFO_CACHE_TTL, info)
+            return info
+        finally:
+            if self._info_read is info_read:
+                self._info_read = None
+
+    def _invalidate_extraction_info(self):
+        """Invalidate recently read or in-flight extraction info, if any"""
+        self._recent_info = None
+        self._info_read = None
 
     @debug
     async def store_extraction_result(self, content, rank, store_content):
         """Cache ranked extraction result and optionally content too"""
         pipe = self.client.pipeline()
+        self._queue_extraction_result(pipe, content, rank, store_content)
+        return await pipe.execute()
+
+    @debug
+    async def store_extraction_results(self, ranked_content, store_content):
+        """Cache (content, rank) extraction results in one round-trip"""
+        pipe = self.client.pipeline()
+        for content, rank in ranked_content:
+            self._queue_extraction_result(pipe, content, rank, store_content)
+        return await pipe.execute()
+
+    def _queue_extraction_result(self, pipe, content, rank, store_content):
+        """Queue ranked extraction result (and content) on pipeline"""
         content_key = self._form_content_key(content.source_url)
-        cache_search_result = pipe.zadd(self.search_results_key, rank, content_key)
-        cache_extraction_result = pipe.zadd(self.extraction_results_key, rank, content_key)
-        cache_futures = [cache_search_result, cache_extraction_result]
+        pipe.zadd(self.search_results_key, rank, content_key)
+        pipe.zadd(self.extraction_results_key, rank, content_key)
 
         if store_content:
             content_hash = self._prepare_content(content)
-            cache_content = pipe.hmset_dict(content_key, content_hash)
-            cache_futures.append(cache_content)
-
-        await pipe.execute()
-        return await asyncio.gather(*cache_futures)
+            pipe.hmset_dict(content_key, content_hash)
 
     async def retrieve_extraction_results(self):
         """Retrieve all cached content for extractor and search data"""
@@ -184,3 +264,5 @@ class MultiExtractorCache(ContentCache):
                                                                   **self.search_data)
         self.extraction_results_key = self._form_extraction_results_key(self.directory,
                                                                         **self.search_data)
+        self._recent_info = None  # (expiration, info) from last read
+        self._info_read = None  # in-flight read future, if any
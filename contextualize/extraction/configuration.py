@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 import datetime
+import logging
 
 from ruamel import yaml
 
@@ -10,7 +11,12 @@ from contextualize.utils.cache import FileCache
 from contextualize.utils.enum import FlexEnum
 from contextualize.utils.statistics import HumanDwellTime
 from contextualize.utils.structures import DotNotatableOrderedDict
-from contextualize.utils.tools import PP, xor_constrain
+from contextualize.utils.tools import PrettyMessage, xor_constrain
+
+logger = logging.getLogger(__name__)
+
+# Parse via libyaml when available, as the pure Python loader is far slower
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
 
 class BaseConfiguration(DotNotatableOrderedDict):
@@ -75,7 +81,7 @@ class ExtractorConfiguration(BaseConfiguration):
     def _marshal_from_file(cls, file_path):
         """Marshall configuration dictionary from file, given a path"""
         with open(file_path) as stream:
-            return yaml.safe_load(stream)
+            return yaml.load(stream, Loader=YAML_LOADER)
 
     @classmethod
     def from_dict(cls, configuration, extractor):
@@ -170,22 +176,16 @@ class DelayConfiguration(HumanDwellTime, BaseConfiguration):
     def from_dict(cls, configuration=None):
         delay_kwargs = cls.ARGUMENT_DEFAULTS._asdict()
         if configuration:
-            delay_kwargs.update(configuration)
-            cls.cleanse_kwargs(delay_kwargs)
+            unsupported = configuration.keys() - delay_kwargs.keys()
+            if unsupported:
+                logger.warning(PrettyMessage(
+                    msg='Unsupported keys in delay configuration',
+                    type='unsupported_keys_in_delay_configuration',
+                    unsupported=unsupported))
+            delay_kwargs.update((k, v) for k, v in configuration.items() if k in delay_kwargs)
 
         return cls(**delay_kwargs)
 
-    @classmethod
-    def cleanse_kwargs(cls, kwargs):
-        if len(kwargs) > len(cls.ARGUMENT_DEFAULTS):
-            unsupported = kwargs.keys() - cls.ARGUMENT_DEFAULTS._asdict().keys()
-            for key in unsupported:
-                del kwargs[key]
-            PP.pprint(dict(
-                msg='Unsupported keys in delay configuration',
-                type='unsupported_keys_in_delay_configuration',
-                unsupported=unsupported))
-
 
 class ContentConfiguration(BaseConfiguration):
 
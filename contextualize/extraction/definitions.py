@@ -31,15 +31,25 @@ class ExtractionStatus(IncreasingEnum):
         PRELIMINARY : 1+ extractions PRELIMINARY
         COMPLETED   : all extractions COMPLETED
         """
-        minimum = cls.minimum(*statuses, nullable=True)
+        if not statuses:
+            return None
+
+        # Find minimum and maximum in a single pass over the statuses
+        values = (value for value in cls.values(*statuses, nullable=True) if value is not None)
+        minimum = maximum = next(values, None)
         if minimum is None:
             return None
 
-        if minimum is cls.COMPLETED:
+        for value in values:
+            if value < minimum:
+                minimum = value
+            elif value > maximum:
+                maximum = value
+
+        if minimum == cls.COMPLETED.value:
             return cls.COMPLETED
 
-        maximum = cls.maximum(*statuses, nullable=True)
-        if maximum >= cls.PRELIMINARY:
+        if maximum >= cls.PRELIMINARY.value:
             return cls.PRELIMINARY
 
-        return maximum
+        return cls(maximum)
@@ -2,11 +2,12 @@
 # -*- coding: utf-8 -*-
 import asyncio
 import datetime
+import logging
 import os
-import urllib
+import stat
 from collections import OrderedDict, defaultdict, namedtuple
 from itertools import chain
-from pathlib import Path
+from urllib.parse import urlsplit
 
 from ruamel import yaml
 from selenium import webdriver
@@ -25,7 +26,6 @@ from contextualize.extraction.info import ExtractionInfo
 from contextualize.extraction.operation import ExtractionOperation
 from contextualize.services.secret_service.agency import SecretService
 from contextualize.utils.asynchronous import run_in_executor
-from contextualize.utils.cache import FileCache
 from contextualize.utils.context import FlexContext
 from contextualize.utils.debug import debug
 from contextualize.utils.enum import FlexEnum
@@ -35,8 +35,11 @@ from contextualize.utils.statistics import (
 )
 from contextualize.utils.time import GranularDateTime
 from contextualize.utils.tools import (
-    PP, derive_domain, enlist, is_nonstring_sequence, xor_constrain
+    MISSING, PrettyMessage, derive_domain, enlist, is_nonstring_sequence, xor_constrain
 )
+from contextualize.utils.webdriver_pool import WebDriverPool
+
+logger = logging.getLogger(__name__)
 
 
 class BaseExtractor:
@@ -47,12 +50,20 @@ class BaseExtractor:
 
     WebDriverBrand = FlexEnum('WebDriverBrand', 'CHROME FIREFOX')
     WEB_DRIVER_BRAND_DEFAULT = WebDriverBrand.CHROME
+    # Web driver brands by selenium module name, e.g. 'chrome'
+    WEB_DRIVER_BRAND_BY_MODULE = {brand.name.lower(): brand for brand in WebDriverBrand}
 
     WebDriverInfo = namedtuple('WebDriverInfo', 'brand type kwargs')
 
+    # Content is extracted from text, so skip loading images and prompts
+    CHROME_PREFERENCES = {
+        'profile.managed_default_content_settings.images': 2,  # block
+        'profile.default_content_setting_values.notifications': 2,  # block
+    }
+
     Status = ExtractionStatus
 
-    configuration_file_cache = FileCache(maxsize=None)
+    web_driver_pool = None  # WebDriverPool, set once BaseExtractor is defined
 
     @debug
     async def extract(self):
@@ -63,15 +74,14 @@ class BaseExtractor:
         extractor is enabled and extraction is successful, else None.
         """
         if not self.configuration.is_enabled:
-            PP.pprint(dict(
-                msg='WARNING: extracting with disabled extractor',
-                type='extractor_disabled_warning', extractor=repr(self)))
+            logger.warning(PrettyMessage(
+                msg='Extracting with disabled extractor',
+                type='extractor_disabled_warning', extractor=self))
             return
 
         if await self._load_cached_content():
             return self.extracted_content
 
-        # TODO: Add WebDriverPool context manager to acquire/release
         try:
             if not self.web_driver:
                 await self._acquire_web_driver()
@@ -86,17 +96,16 @@ class BaseExtractor:
 
     @debug
     async def _acquire_web_driver(self):
-        """Acquire web driver"""
-        self.web_driver = await self._provision_web_driver(
-            web_driver_type=self.web_driver_type,
-            web_driver_kwargs=self.web_driver_kwargs,
-            implicit_wait=self.configuration.implicit_wait,
-            loop=self.loop)
+        """Acquire web driver from pool, configured for the extractor"""
+        web_driver = await self.web_driver_pool.checkout(self.web_driver_type, loop=self.loop)
+        self._configure_web_driver(web_driver, implicit_wait=self.configuration.implicit_wait)
+        self.web_driver = web_driver
 
     @debug
     async def _release_web_driver(self):
-        """Release web driver"""
-        await self._deprovision_web_driver(web_driver=self.web_driver, loop=self.loop)
+        """Release web driver back to pool"""
+        web_driver, self.web_driver = self.web_driver, None
+        await self.web_driver_pool.checkin(web_driver, loop=self.loop)
 
     @classmethod
     @debug
@@ -108,12 +117,16 @@ class BaseExtractor:
             web_driver_brand, web_driver_type, web_driver_kwargs)
 
         web_driver = await run_in_executor(loop, None, web_driver_type, **web_driver_kwargs)
-        # Configure web driver to allow waiting on each operation
+        cls._configure_web_driver(web_driver, implicit_wait)
+        web_driver.last_fetch_timestamp = None
+        return web_driver
+
+    @classmethod
+    def _configure_web_driver(cls, web_driver, implicit_wait=None):
+        """Configure web driver to allow waiting on each operation"""
         implicit_wait = (ExtractorConfiguration.IMPLICIT_WAIT_DEFAULT if implicit_wait is None
                          else implicit_wait)
         web_driver.implicitly_wait(implicit_wait)
-        web_driver.last_fetch_timestamp = None
-        return web_driver
 
     @classmethod
     @debug
@@ -127,7 +140,8 @@ class BaseExtractor:
     async def _perform_page_fetch(self, url):
         """Perform page fetch of given URL by running in executor"""
         future_page = self._execute_in_future(self.web_driver.get, url)
-        self.web_driver.last_fetch_timestamp = datetime.datetime.utcnow()
+        # Monotonic loop time, as the timestamp is only used to derive delays
+        self.web_driver.last_fetch_timestamp = self.loop.time()
         await future_page
 
     @debug
@@ -143,7 +157,7 @@ class BaseExtractor:
         **kwds:     Additional keyword args passed to content
         return:     Instance of content model (e.g. ResearchArticle)
         """
-        self.content_map = content_map = OrderedDict(kwds)
+        self.content_map = content_map = dict(kwds)
         source_url = content_map.get(self.SOURCE_URL_TAG)
         if not source_url:
             source_url = await self._extract_content_field(field=self.SOURCE_URL_TAG,
@@ -152,7 +166,7 @@ class BaseExtractor:
 
         with FlexContext(source_url=source_url):
             # Allow field to be otherwise set without overwriting
-            fields_to_extract = (f for f in self.model.field_names() if f not in content_map)
+            fields_to_extract = (f for f in self.field_configurations if f not in content_map)
             for field in fields_to_extract:
                 await self._extract_content_field(field=field, element=element, index=index)
 
@@ -160,32 +174,45 @@ class BaseExtractor:
         instance = self.model(**content_map)
         return instance
 
+    @property
+    def field_configurations(self):
+        """Ordered map of model fields to configurations, else MISSING"""
+        field_configurations = self._field_configurations
+        if field_configurations is None:
+            content_configuration = self.configuration.content
+            field_configurations = {field: content_configuration.get(field, MISSING)
+                                    for field in self.model.field_names()}
+            self._field_configurations = field_configurations
+        return field_configurations
+
     @debug()
     async def _extract_content_field(self, field, element, index=1):
-        content_configuration = self.configuration.content
-        try:
-            field_configuration = content_configuration[field]
-
-        except KeyError as e:
+        field_configurations = self.field_configurations
+        field_configuration = field_configurations.get(field, MISSING)
+        if field_configuration is MISSING:
             self.content_map[field] = None
-            PP.pprint(dict(
+            logger.warning(PrettyMessage(
                 msg='Extract field configuration missing',
                 type='extract_field_configuration_missing',
-                error=e, field=field, content_map=self.content_map, extractor=repr(self)))
-        else:
-            try:
-                field_value = await self._extract_field(field=field,
-                                                        element=element,
-                                                        configuration=field_configuration,
-                                                        index=index)
-                self.content_map[field] = field_value
-                return field_value
-
-            except Exception as e:  # e.g. NoSuchElementException
-                PP.pprint(dict(
-                    msg='Extract field failure', type='extract_field_failure',
-                    error=e, field=field, content_map=self.content_map, extractor=repr(self)))
-                # TODO: re-raise if required field
+                field=field, content_map=self.content_map, extractor=self))
+            # Report once, then treat model fields as configured with None
+            if field in field_configurations:
+                field_configurations[field] = None
+            return
+
+        try:
+            field_value = await self._extract_field(field=field,
+                                                    element=element,
+                                                    configuration=field_configuration,
+                                                    index=index)
+            self.content_map[field] = field_value
+            return field_value
+
+        except Exception as e:  # e.g. NoSuchElementException
+            logger.error(PrettyMessage(
+                msg='Extract field failure', type='extract_field_failure',
+                error=e, field=field, content_map=self.content_map, extractor=self))
+            # TODO: re-raise if required field
 
     @debug
     async def _extract_field(self, field, element, configuration, index=1):
@@ -281,7 +308,8 @@ class BaseExtractor:
         if web_driver_type:
             module_path = web_driver_type.__module__
             web_driver_brand_name = module_path.split('.')[-2]
-            return cls.WebDriverBrand.cast(web_driver_brand_name)
+            web_driver_brand = cls.WEB_DRIVER_BRAND_BY_MODULE.get(web_driver_brand_name)
+            return web_driver_brand or cls.WebDriverBrand.cast(web_driver_brand_name)
         return cls.WEB_DRIVER_BRAND_DEFAULT
 
     @classmethod
@@ -303,6 +331,7 @@ class BaseExtractor:
             options.add_argument('--disable-extensions')
             options.add_argument('--disable-infobars')
             options.add_argument(f'user-agent={user_agent}')
+            options.add_experimental_option('prefs', cls.CHROME_PREFERENCES)
             return dict(options=options)
         elif web_driver_brand is cls.WebDriverBrand.FIREFOX:
             raise NotImplementedError('Firefox not yet supported')
@@ -331,6 +360,7 @@ class BaseExtractor:
         self.file_path = self._form_file_path(self.base_directory, self.directory)
         self.configuration = ExtractorConfiguration.from_file(file_path=self.file_path,
                                                               extractor=self)
+        self._field_configurations = None  # Mapped from configuration upon first use
 
         self.web_driver = web_driver
         self.reuse_web_driver = bool(web_driver) if reuse_web_driver is None else reuse_web_driver
@@ -350,17 +380,27 @@ class BaseExtractor:
         return (f'<{class_name}: {directory}, {created_timestamp}>')
 
 
+BaseExtractor.web_driver_pool = WebDriverPool(
+    provision=BaseExtractor._provision_web_driver,
+    deprovision=BaseExtractor._deprovision_web_driver)
+
+
 class SourceExtractor(BaseExtractor):
 
     FILE_NAME = SourceExtractorConfiguration.FILE_NAME
 
-    HTTPS_TAG = 'https://'
-    HTTP_TAG = 'http://'
+    # Maximum number of domains extracted concurrently, each with a web driver
+    MAX_PARALLEL_DOMAINS = 8
+    # Seconds after which domains still being extracted are cancelled
+    PARALLEL_EXTRACTION_TIMEOUT = 600
+
+    # Source directories and checked directory mtimes by (base, path components)
+    _source_directories = {}
+
     WWW_DOT_TAG = 'www.'
     DOMAIN_DELIMITER = '.'
     DIRECTORY_NAME_DELIMITER = '_'
     PATH_DELIMITER = '/'
-    QUERY_STRING_DELIMITER = '?'
 
     async def extract(self):
         """Extract within source extractor context"""
@@ -395,9 +435,9 @@ class SourceExtractor(BaseExtractor):
                                                   source_url=self.page_url,
                                                   rank=None)
         except Exception as e:
-            PP.pprint(dict(
+            logger.error(PrettyMessage(
                 msg='Extract content failure', type='extract_content_failure',
-                error=e, extractor=repr(self), configuration=self.configuration.content))
+                error=e, extractor=self, configuration=self.configuration.content))
             raise
         else:
             self.extracted_content = content
@@ -412,7 +452,13 @@ class SourceExtractor(BaseExtractor):
         Extract in parallel
 
         Extract content in parallel from multiple domains. For  each
-        domain, source URLs are extracted in series with delays.
+        domain, source URLs are extracted in series with delays. At most
+        MAX_PARALLEL_DOMAINS domains are extracted at once, bounding the
+        number of web drivers in use. Each domain is cancelled if still
+        being extracted PARALLEL_EXTRACTION_TIMEOUT seconds after it
+        starts, excluding time queued for a turn. Domains that fail or
+        time out are logged and do not prevent results from other domains
+        being returned.
 
         I/O:
         model:                  Extractable content class
@@ -432,22 +478,44 @@ class SourceExtractor(BaseExtractor):
         return:                 List of extracted content instances
         """
         web_driver_brand = cls._derive_web_driver_brand(type(search_web_driver))
+        semaphore = asyncio.Semaphore(cls.MAX_PARALLEL_DOMAINS)
+
+        async def extract_domain_in_series(domain, urls):
+            async with semaphore:
+                future = asyncio.ensure_future(cls.extract_in_series(
+                    model=model,
+                    urls=urls,
+                    web_driver=search_web_driver if domain == search_domain else None,
+                    web_driver_brand=web_driver_brand,
+                    use_cache=use_cache,
+                    loop=loop), loop=loop)
+                done, _ = await asyncio.wait((future,), timeout=cls.PARALLEL_EXTRACTION_TIMEOUT)
+                if not done:
+                    # Don't wait on the cancelled series, as its fetch may be hung
+                    future.cancel()
+                    raise asyncio.TimeoutError
+                return future.result()
+
+        domains = list(urls_by_domain)
+        domain_results = await asyncio.gather(
+            *(extract_domain_in_series(domain, urls_by_domain[domain]) for domain in domains),
+            loop=loop, return_exceptions=True)
+
+        successful_results = []
+        for domain, domain_result in zip(domains, domain_results):
+            if isinstance(domain_result, asyncio.TimeoutError):
+                logger.warning(PrettyMessage(
+                    msg='Extract in series timeout', type='extract_in_series_timeout',
+                    timeout=cls.PARALLEL_EXTRACTION_TIMEOUT, domain=domain,
+                    urls=urls_by_domain[domain]))
+            elif isinstance(domain_result, BaseException):
+                logger.error(PrettyMessage(
+                    msg='Extract in series failure', type='extract_in_series_failure',
+                    error=domain_result, domain=domain, urls=urls_by_domain[domain]))
+            else:
+                successful_results.append(domain_result)
 
-        futures = [cls.extract_in_series(
-                   model=model,
-                   urls=urls,
-                   web_driver=search_web_driver if domain == search_domain else None,
-                   web_driver_brand=web_driver_brand,
-                   use_cache=use_cache,
-                   loop=loop)
-                   for domain, urls in urls_by_domain.items()]
-
-        if not futures:
-            return []
-        done, pending = await asyncio.wait(futures)
-        series_results = [task.result() for task in done]
-        source_results = chain(*series_results)
-        return source_results
+        return list(chain.from_iterable(successful_results))
 
     @classmethod
     @debug
@@ -465,7 +533,8 @@ class SourceExtractor(BaseExtractor):
         urls:                       List of content URL strings
 
         web_driver=None:            Selenium webdriver (optional);
-                                    if not provided, one is provisioned.
+                                    if not provided, one is checked out
+                                    from the web driver pool.
 
         web_driver_brand=None:      WebDriverBrand, default: CHROME
 
@@ -484,10 +553,10 @@ class SourceExtractor(BaseExtractor):
             reuse_web_driver = reuse_web_driver if reuse_web_driver is not None else True
         else:
             reuse_web_driver = reuse_web_driver or False
-            web_driver = await cls._provision_web_driver(web_driver_brand=web_driver_brand,
-                                                         loop=loop)
-        # TODO: replace with WebDriverPool.provision_web_driver(web_driver) as web_driver:
-        # Context manager should set web_driver._should_reuse on web driver returned
+            web_driver_type = cls._derive_web_driver_type(web_driver_brand)
+            web_driver = await cls.web_driver_pool.checkout(web_driver_type, loop=loop)
+            # Pooled drivers may keep the implicit wait of a previous extractor
+            cls._configure_web_driver(web_driver)
         try:
             source_results = []
 
@@ -504,9 +573,14 @@ class SourceExtractor(BaseExtractor):
                 if source_result:
                     source_results.append(source_result)
 
-        finally:
+        except (Exception, asyncio.CancelledError):
+            # Quit rather than pool the driver, as a fetch may still be hung
             if not reuse_web_driver:
-                await cls._deprovision_web_driver(web_driver=web_driver, loop=loop)
+                await cls.web_driver_pool.deprovision(web_driver=web_driver, loop=loop)
+            raise
+
+        if not reuse_web_driver:
+            await cls.web_driver_pool.checkin(web_driver, loop=loop)
 
         return source_results
 
@@ -519,12 +593,10 @@ class SourceExtractor(BaseExtractor):
     @debug
     async def _delay_if_necessary(self):
         last_fetch_timestamp = self.web_driver.last_fetch_timestamp
-        if not last_fetch_timestamp:  # no delay the first time
+        if last_fetch_timestamp is None:  # no delay the first time
             return
         delay = self.configuration.delay.random_delay()
-        now = datetime.datetime.utcnow()
-        delta_since_last_fetch = now - last_fetch_timestamp
-        elapsed_seconds = delta_since_last_fetch.total_seconds()
+        elapsed_seconds = self.loop.time() - last_fetch_timestamp
         remaining_delay = delay - elapsed_seconds if delay > elapsed_seconds else 0
         if remaining_delay:
             await asyncio.sleep(remaining_delay)
@@ -574,7 +646,9 @@ class SourceExtractor(BaseExtractor):
                     yield extractor
             # FileNotFoundError, ruamel.yaml.scanner.ScannerError, ValueError
             except Exception as e:
-                print(e)  # TODO: Replace with logging
+                logger.error(PrettyMessage(
+                    msg='Provision source extractor failure',
+                    type='provision_source_extractor_failure', error=e, url=url))
 
     def _derive_directory(self, model, page_url):
         """Derive directory from base set on model and page URL"""
@@ -584,43 +658,81 @@ class SourceExtractor(BaseExtractor):
         base_url = url_path[0]
         base_url_directory = base_url.replace(self.DOMAIN_DELIMITER,
                                               self.DIRECTORY_NAME_DELIMITER)
-        path_components = [base_url_directory] + url_path[1:]
+        path_components = (base_url_directory, *url_path[1:])
+        directory = self._find_directory(base_directory, path_components)
+        if directory is None:
+            raise FileNotFoundError(f'Source extractor configuration not found for {page_url}')
+        return directory
+
+    @classmethod
+    def _find_directory(cls, base_directory, path_components):
+        """
+        Find directory
+
+        Find deepest source configuration directory, else None. Results
+        are cached until any checked directory is modified, as adding or
+        removing files or subdirectories updates the mtime of the
+        containing directory.
+
+        I/O:
+        base_directory:     Base directory path, e.g. model.PROVIDER_DIRECTORY
+        path_components:    Tuple of directory names derived from a URL
+        return:             Configuration directory relative to base, else None
+        """
+        key = (base_directory, path_components)
+        cached = cls._source_directories.get(key)
+        if cached:
+            directory_mtimes, directory = cached
+            try:
+                if all(os.stat(path).st_mtime_ns == mtime for path, mtime in directory_mtimes):
+                    return directory
+            except FileNotFoundError:
+                pass
+
+        # Stat each directory before checking its contents, so any later
+        # change to them invalidates the cached result
+        try:
+            directory_mtimes = [(base_directory, os.stat(base_directory).st_mtime_ns)]
+        except FileNotFoundError:
+            return None
         num_components = deepest_index = len(path_components)
 
         # Find deepest directory
         for i in range(num_components):
-            sub_directory = self.PATH_DELIMITER.join(path_components[:i + 1])
+            sub_directory = cls.PATH_DELIMITER.join(path_components[:i + 1])
             path = os.path.join(base_directory, sub_directory)
-            if not Path(path).is_dir():
+            try:
+                path_stat = os.stat(path)
+            except OSError:  # e.g. FileNotFoundError, NotADirectoryError
+                path_stat = None
+            if path_stat is None or not stat.S_ISDIR(path_stat.st_mode):
                 deepest_index = i
                 break
+            directory_mtimes.append((path, path_stat.st_mtime_ns))
 
         # Look for source configuration directory, starting with deepest
+        directory = None
         for i in range(deepest_index, 0, -1):
-            sub_directory = self.PATH_DELIMITER.join(path_components[:i])
-            path = os.path.join(base_directory, sub_directory, self.FILE_NAME)
-            if Path(path).is_file():
-                return sub_directory
-
-        raise FileNotFoundError(f'Source extractor configuration not found for {page_url}')
-
-    # TODO: rewrite to use urlparse and include www in directories?
-    def _clip_url(self, url):
-        """Clip URL to just contain host and path"""
-        start = 0
-        if url.startswith(self.HTTPS_TAG):
-            start = len(self.HTTPS_TAG)
-        elif url.startswith(self.HTTP_TAG):
-            start = len(self.HTTP_TAG)
-        www_index = url.find(self.WWW_DOT_TAG)
-        if www_index == start:
-            start += len(self.WWW_DOT_TAG)
-        query_index = url.find(self.QUERY_STRING_DELIMITER)
-        end = query_index if query_index > -1 else len(url)
-        if url[end - 1] == self.PATH_DELIMITER:
-            end -= 1
-        clipped_url = url[start:end]
-        return clipped_url
+            sub_directory = cls.PATH_DELIMITER.join(path_components[:i])
+            path = os.path.join(base_directory, sub_directory, cls.FILE_NAME)
+            if os.path.isfile(path):
+                directory = sub_directory
+                break
+
+        cls._source_directories[key] = (tuple(directory_mtimes), directory)
+        return directory
+
+    @classmethod
+    def _clip_url(cls, url):
+        """Clip URL to just contain host (sans www) and path"""
+        # urlsplit only finds a netloc after '//', so add it if no scheme
+        has_netloc = '://' in url or url.startswith('//')
+        split_url = urlsplit(url if has_netloc else f'//{url}')
+        host = split_url.netloc
+        if host.startswith(cls.WWW_DOT_TAG):
+            host = host[len(cls.WWW_DOT_TAG):]
+        path = split_url.path.rstrip(cls.PATH_DELIMITER)
+        return f'{host}{path}'
 
     def __init__(self, model, page_url, web_driver=None, web_driver_brand=None,
                  reuse_web_driver=None, use_cache=True, loop=None):
@@ -647,6 +759,9 @@ class MultiExtractor(BaseExtractor):
 
     FILE_NAME = MultiExtractorConfiguration.FILE_NAME
 
+    # Configured directories and walked directory mtimes by (base, file name)
+    _configured_directories = {}
+
     async def extract(self):
         """Extract within multi-extractor context"""
         with FlexContext(provider_directory=self.directory, search_data=self.search_data):
@@ -662,16 +777,23 @@ class MultiExtractor(BaseExtractor):
         content is extracted, but not returned.
         """
         url = url or self.page_url
-        await self._perform_page_fetch(url)
-        await self._perform_page_extraction(page=1)
+        try:
+            await self._perform_page_fetch(url)
+            await self._perform_page_extraction(page=1)
 
-        if self.configuration.pagination.pages > 1:
-            more_pages = True
-            page = 2
+            if self.configuration.pagination.pages > 1:
+                more_pages = True
+                page = 2
 
-            while more_pages:
-                more_pages = await self._perform_next_page_extraction(page)
-                page += 1
+                while more_pages:
+                    more_pages = await self._perform_next_page_extraction(page)
+                    page += 1
+
+        finally:
+            # Results must be stored before extraction is complete
+            pending_stores, self._pending_stores = self._pending_stores, []
+            if pending_stores:
+                await asyncio.gather(*pending_stores)
 
     @debug
     async def _perform_next_page_extraction(self, page):
@@ -730,84 +852,150 @@ class MultiExtractor(BaseExtractor):
                                              configuration=self.configuration.content_items)
 
         if elements is None:
-            PP.pprint(dict(
+            logger.error(PrettyMessage(
                 msg='Extract content items failure', type='extract_content_items_failure',
-                extractor=repr(self), configuration=self.configuration.content_items))
+                extractor=self, configuration=self.configuration.content_items))
             return
 
         extract_sources = self.configuration.extract_sources
+        rank_offset = (page - 1) * self.configuration.pagination.page_size
+        ranked_content = []
 
+        # Items share the web driver and may click or wait, so extract in series
         for index, element in enumerate(elements, start=1):
-            rank = (page - 1) * self.configuration.pagination.page_size + index
+            rank = rank_offset + index
             try:
                 content = await self._extract_content(element, index, rank=rank)
                 source_url = content.source_url
                 if not source_url:
                     raise ValueError(f"Content missing source_url")
-
             except Exception as e:
-                PP.pprint(dict(
+                logger.error(PrettyMessage(
                     msg='Extract content failure', type='extract_content_failure',
-                    error=e, page=page, index=index, rank=rank, extractor=repr(self)))
+                    error=e, page=page, index=index, rank=rank, extractor=self))
                 continue
 
             if source_url in self.extracted_content:
-                PP.pprint(dict(
+                logger.warning(PrettyMessage(
                     msg='Source url collision; keeping new content', type='source_url_collision',
                     source_url=source_url, old_content=self.extracted_content[source_url],
-                    new_content=content, page=page, index=index, rank=rank, extractor=repr(self)))
-
-            # TODO: store all page results at once instead of incrementally?
-            if self.use_cache:
-                await self.cache.store_extraction_result(
-                    content=content, rank=rank, store_content=not extract_sources)
+                    new_content=content, page=page, index=index, rank=rank, extractor=self))
 
+            ranked_content.append((content, rank))
             self.extracted_content[source_url] = content
 
-        if extract_sources:
-            await self._update_status(ExtractionStatus.PRELIMINARY)
-            source_results = await self._extract_sources(self.extracted_content)
-            await self._combine_results(self.extracted_content, source_results)
+        if not extract_sources:
+            if self.use_cache and ranked_content:
+                # Store while the next page is fetched, as it's independent of the web driver
+                self._pending_stores.append(asyncio.ensure_future(
+                    self.cache.store_extraction_results(
+                        ranked_content=ranked_content, store_content=True)))
+            return
+
+        # Cache preliminary results while sources are being extracted
+        _, source_results = await asyncio.gather(
+            self._store_preliminary_results(ranked_content),
+            self._extract_sources(self.extracted_content))
+        await self._combine_results(self.extracted_content, source_results)
+
+    @debug
+    async def _store_preliminary_results(self, ranked_content):
+        """Store (content, rank) results sans content and update status"""
+        if self.use_cache and ranked_content:
+            await self.cache.store_extraction_results(
+                ranked_content=ranked_content, store_content=False)
+        await self._update_status(ExtractionStatus.PRELIMINARY)
 
     @debug
     async def _extract_sources(self, extracted_content):
-        """Extract sources given extracted content"""
+        """
+        Extract sources given extracted content
+
+        Sources already claimed by an extractor in the cohort are awaited
+        rather than extracted again, so extractors finding the same
+        source URL coalesce to a single source extraction. Source URLs
+        are matched once normalized, so results are keyed by the source
+        URLs of the given content rather than their own.
+
+        I/O:
+        extracted_content:  Dict of content keyed by source URL
+        return:             Dict of extracted source content instances
+                            keyed by source URL of extracted content
+        """
         search_domain = derive_domain(self.page_url)
-        source_urls = (content.source_url for content in extracted_content.values())
+        source_extractions = self._source_extractions
+        claimed_extractions = {}
+        extractions = {}  # source extraction futures by source URL of content
         urls_by_domain = defaultdict(list)
 
-        for source_url in source_urls:
-            source_domain = derive_domain(source_url, base=search_domain)
-            urls_by_domain[source_domain].append(source_url)
-
-        for domain, urls in urls_by_domain.items():
+        for content in extracted_content.values():
+            source_url = content.source_url
+            normalized_url = url_normalize(source_url)
+            source_extraction = source_extractions.get(normalized_url)
+            if source_extraction is None:
+                source_extraction = self.loop.create_future()
+                source_extractions[normalized_url] = source_extraction
+                claimed_extractions[normalized_url] = source_extraction
+                source_domain = derive_domain(source_url, base=search_domain)
+                urls_by_domain[source_domain].append(source_url)
+            extractions[source_url] = source_extraction
+
+        for urls in urls_by_domain.values():
             human_selection_shuffle(urls)
 
-        return await SourceExtractor.extract_in_parallel(
-            model=self.model,
-            urls_by_domain=urls_by_domain,
-            search_domain=search_domain,
-            search_web_driver=self.web_driver,
-            use_cache=self.use_cache,
-            loop=self.loop)
+        try:
+            extracted_sources = await SourceExtractor.extract_in_parallel(
+                model=self.model,
+                urls_by_domain=urls_by_domain,
+                search_domain=search_domain,
+                search_web_driver=self.web_driver,
+                use_cache=self.use_cache,
+                loop=self.loop)
+
+            for source_result in extracted_sources:
+                normalized_url = url_normalize(source_result.source_url)
+                source_extraction = claimed_extractions.get(normalized_url)
+                if source_extraction and not source_extraction.done():
+                    source_extraction.set_result(source_result)
+        finally:
+            # Sources that failed to be extracted have no result
+            for source_extraction in claimed_extractions.values():
+                if not source_extraction.done():
+                    source_extraction.set_result(None)
+
+        source_urls = list(extractions)
+        results = await asyncio.gather(*extractions.values())
+        return {source_url: source_result for source_url, source_result
+                in zip(source_urls, results) if source_result is not None}
 
     @debug
     async def _combine_results(self, extracted_content, source_results):
-        """Combine results extracted from search with source content"""
-        for source_result in source_results:
-            source_url = source_result.source_url
+        """
+        Combine results extracted from search with source content
+
+        I/O:
+        extracted_content:  Dict of content keyed by source URL
+        source_results:     Dict of source content keyed by source URL
+                            of extracted content, as from _extract_sources
+        """
+        is_debug = logger.isEnabledFor(logging.DEBUG)
+        for source_url, source_result in source_results.items():
             content_result = extracted_content[source_url]
-            source_overrides = ((k, v) for k, v in source_result.field_items() if v is not None)
-            for field, source_value in source_overrides:
-                item_value = getattr(content_result, field)
-                if item_value is not None and item_value != source_value:
-                    PP.pprint(dict(
-                        msg='Overwriting content field value from source',
-                        type='overwriting_content_field_value_from_source',
-                        extractor=repr(self), field=field,
-                        item_value=item_value, source_value=source_value))
-
-                setattr(content_result, field, source_value)
+            source_overrides = {k: v for k, v in source_result.field_items() if v is not None}
+            # Overwriting is expected, so only reported when debug logging
+            if is_debug:
+                content_fields = vars(content_result)
+                overwrites = {k: (content_fields[k], v) for k, v in source_overrides.items()
+                              if content_fields[k] is not None and content_fields[k] != v}
+                if overwrites:
+                    logger.debug(PrettyMessage(
+                        msg='Overwriting content field values from source',
+                        type='overwriting_content_field_values_from_source',
+                        extractor=self, source_url=source_url,
+                        item_and_source_values=overwrites))
+
+            # Public fields are plain dataclass attributes, so update at once
+            vars(content_result).update(source_overrides)
 
     @debug
     async def _load_cached_content(self):
@@ -887,11 +1075,10 @@ class MultiExtractor(BaseExtractor):
         yield:                  Fully configured search extractors
         """
         base = model.PROVIDER_DIRECTORY
-        dir_nodes = os.walk(base)
-        directories = (cls._debase_directory(base, dn[0]) for dn in dir_nodes
-                       if cls.FILE_NAME in dn[2])
+        directories = cls._find_configured_directories(base)
 
         extractors = {}
+        source_extractions = {}
         for directory in directories:
             try:
                 extractor = cls(model=model,
@@ -907,21 +1094,71 @@ class MultiExtractor(BaseExtractor):
                     extractors[directory] = extractor
             # FileNotFoundError, ruamel.yaml.scanner.ScannerError, ValueError
             except Exception as e:
-                print(e)  # TODO: Replace with logging
+                logger.error(PrettyMessage(
+                    msg='Provision multi extractor failure',
+                    type='provision_multi_extractor_failure', error=e, directory=directory))
 
         for extractor in extractors.values():
-            extractor._set_cohort(extractors)
+            extractor._set_cohort(extractors, source_extractions)
             yield extractor
 
-    def _set_cohort(self, extractors):
+    @property
+    def cache(self):
+        """Multi extractor cache, created upon first use, else None"""
+        cache = self._cache
+        if cache is None and self.use_cache:
+            cache = MultiExtractorCache(directory=self.directory,
+                                        search_data=self.search_data,
+                                        cache_version=self.configuration.cache_version,
+                                        loop=self.loop)
+            self._cache = cache
+        return cache
+
+    def _set_cohort(self, extractors, source_extractions):
         """Set cohort to dictionary of extractors keyed by directory"""
         self.cohort = extractors
+        self._source_extractions = source_extractions
 
     @property
     def cohort_status_values(self):
         """Cohort status values are emitted by the returned generator"""
         return (extractor.status.value for extractor in self.cohort.values())
 
+    @classmethod
+    def _find_configured_directories(cls, base):
+        """
+        Find configured directories
+
+        Walk base to find directories containing configuration files.
+        Results are cached until any walked directory is modified, as
+        adding or removing files or subdirectories updates the mtime of
+        the containing directory.
+
+        I/O:
+        base:       Base directory path, e.g. model.PROVIDER_DIRECTORY
+        return:     Tuple of configured directories relative to base
+        """
+        key = (base, cls.FILE_NAME)
+        cached = cls._configured_directories.get(key)
+        if cached:
+            directory_mtimes, directories = cached
+            try:
+                if all(os.stat(path).st_mtime_ns == mtime for path, mtime in directory_mtimes):
+                    return directories
+            except FileNotFoundError:
+                pass
+
+        directory_mtimes = []
+        directories = []
+        for path, _, file_names in os.walk(base):
+            directory_mtimes.append((path, os.stat(path).st_mtime_ns))
+            if cls.FILE_NAME in file_names:
+                directories.append(cls._debase_directory(base, path))
+
+        directories = tuple(directories)
+        cls._configured_directories[key] = (tuple(directory_mtimes), directories)
+        return directories
+
     @classmethod
     def _debase_directory(cls, base, path):
         """Remove base from directory path"""
@@ -957,13 +1194,12 @@ class MultiExtractor(BaseExtractor):
                              loop=loop)
 
             self.page_url = self.configuration.url.construct(self.search_data)
-            self.cache = MultiExtractorCache(directory=self.directory,
-                                             search_data=self.search_data,
-                                             cache_version=self.configuration.cache_version,
-                                             loop=self.loop) if self.use_cache else None
+            self._cache = None  # Created upon first use, if using cache
 
-            self.extracted_content = OrderedDict()
+            self.extracted_content = {}  # Content by source URL, in rank order
+            self._pending_stores = []  # Tasks storing page results, awaited by extraction end
             self.cohort = None  # Only set after instantiation
+            self._source_extractions = {}  # Source extraction futures by URL, shared by cohort
 
     def __repr__(self):
         class_name = self.__class__.__name__
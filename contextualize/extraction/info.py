@@ -3,6 +3,8 @@
 from contextualize.extraction.definitions import ExtractionStatus
 from contextualize.utils.time import GranularDateTime
 
+_STATUS_BY_NAME = {status.name: status for status in ExtractionStatus}
+
 
 class ExtractionInfo:
 
@@ -22,7 +24,7 @@ class ExtractionInfo:
 
         try:
             status_name = info_hash[cls.STATUS_KEY]
-            status = ExtractionStatus[status_name]
+            status = _STATUS_BY_NAME[status_name]
         except KeyError:
             status = None
 
@@ -15,8 +15,9 @@ from contextualize.utils.asynchronous import run_in_executor
 from contextualize.utils.debug import debug
 from contextualize.utils.enum import FlexEnum
 from contextualize.utils.iterable import one, one_max, one_min
+from contextualize.utils import tools
 from contextualize.utils.time import GranularDateTime
-from contextualize.utils.tools import PP, delist, enlist, multi_parse
+from contextualize.utils.tools import delist, enlist, multi_parse
 
 
 class ExtractionOperation:
@@ -261,7 +262,7 @@ class ExtractionOperation:
                     parsed_values.append(parsed.named[self.VALUE_TAG])
 
                 except (ValueError, AttributeError, KeyError) as e:
-                    PP.pprint(dict(
+                    tools.PP.pprint(dict(
                         msg='Extractor parse failure', type='extractor_parse_failure',
                         templates=templates, value=value, parsed=parsed,
                         operation=repr(self), extractor=repr(self.extractor), error=e))
@@ -1,7 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import re
 import urllib
 from collections import OrderedDict
+from functools import lru_cache
 from itertools import zip_longest
 
 from contextualize.exceptions import NoneValueError
@@ -19,6 +21,9 @@ class BaseURLConstructor(DotNotatableOrderedDict):
     TOKEN_TEMPLATE = '{{{}}}'
     TOKEN_START = TOKEN_TEMPLATE[0]
     TOKEN_END = TOKEN_TEMPLATE[-1]
+    # Tokens may not contain tokens, so match innermost
+    TOKEN_PATTERN = re.compile('{start}([^{start}{end}]*){end}'.format(
+        start=re.escape(TOKEN_START), end=re.escape(TOKEN_END)))
 
     def _construct_clause(self, template, search_data, topic=None, term=None, index=1):
         """
@@ -39,8 +44,8 @@ class BaseURLConstructor(DotNotatableOrderedDict):
                       TypeError if unexpected type in configuration
         """
         definitions = self.definitions
-        rendered = template
-        tokens = self._find_tokens(template)
+        literals, tokens = self._compile(template)
+        values = []
 
         for token in tokens:
             if token == self.INDEX_TAG:
@@ -70,26 +75,50 @@ class BaseURLConstructor(DotNotatableOrderedDict):
             else:
                 raise ValueError(f'Unknown token: {token}')
 
-            rendered = rendered.replace(self.TOKEN_TEMPLATE.format(token), value)
+            values.append(value)
 
-        return rendered
+        # Render in one pass by interleaving literals with token values
+        rendered = [literals[0]]
+        for value, literal in zip(values, literals[1:]):
+            rendered.append(value)
+            rendered.append(literal)
+        return ''.join(rendered)
 
-    def _find_tokens(self, template):
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _compile(cls, template):
+        """
+        Compile template into literals and tokens
+
+        Split template once so clauses may be rendered by interleaving
+        the literals with token values rather than by replacing each
+        placeholder in turn.
+
+        I/O:
+        template:   string with 0+ tokens specified via {}
+        return:     2-tuple of literals tuple and tokens tuple, where
+                    there is one more literal than there are tokens
+        """
+        literals = []
+        tokens = []
+        literal_start = 0
+        for start, end in cls._find_token_spans(template):
+            literals.append(template[literal_start:start])
+            tokens.append(template[start + 1:end])
+            literal_start = end + 1
+        literals.append(template[literal_start:])
+        return tuple(literals), tuple(tokens)
+
+    @classmethod
+    def _find_tokens(cls, template):
         """Find & yield tokens in template as defined by {}"""
-        length = len(template)
-        start = end = -1
-        while end < length:
-            start = template.find(self.TOKEN_START, start + 1)
-            if start == -1:
-                break
-            end = template.find(self.TOKEN_END, start + 1)
-            if end == -1:
-                break
-            # tokens may not contain tokens, so find innermost
-            new_start = template.rfind(self.TOKEN_START, start + 1, end)
-            if new_start > start:
-                start = new_start
-            yield template[start + 1:end]
+        return (template[start + 1:end] for start, end in cls._find_token_spans(template))
+
+    @classmethod
+    def _find_token_spans(cls, template):
+        """Find & yield (start, end) indices of token delimiters"""
+        for match in cls.TOKEN_PATTERN.finditer(template):
+            yield match.start(), match.end() - 1
 
     def _get_relevant_search_terms(self, token, topic, search_data):
         """Get relevant search terms based on token and topic"""
@@ -144,12 +173,18 @@ class URLConstructor(BaseURLConstructor):
         if value is None:
             return key, None
         if isinstance(value, str):
-            return key, [urllib.parse.quote(value)]
+            return key, [self._quote(value)]
         if is_nonstring_sequence(value):
-            return key, [urllib.parse.quote(v) for v in value]
+            return key, [self._quote(v) for v in value]
         raise TypeError(f"Expected string or list/tuple for '{key}'; "
                         f"received '{type(value)}': {value}")
 
+    # Search data is shared by every extractor provisioned for a search
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _quote(value):
+        return urllib.parse.quote(value)
+
 
 class URLClauseSeries(BaseURLConstructor):
 
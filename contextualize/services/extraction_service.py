@@ -2,12 +2,13 @@
 # -*- coding: utf-8 -*-
 import asyncio
 
+import settings
 from contextualize.content.research_article import ResearchArticle
 from contextualize.extraction.caching import ContentCache
 from contextualize.extraction.definitions import ExtractionStatus
 from contextualize.extraction.extractor import MultiExtractor
+from contextualize.utils import tools
 from contextualize.utils.debug import debug
-from contextualize.utils.tools import PP
 
 
 class ExtractionService:
@@ -64,11 +65,12 @@ class ExtractionService:
             self.provision_extractors()
         futures = {extractor.extract() for extractor in self.extractors}
         done, pending = await asyncio.wait(futures)
-        PP.pprint([task.result() for task in done])
+        if settings.DEBUG:
+            tools.PP.pprint([task.result() for task in done])
         return [task.result() for task in done]
 
     def __init__(self, search_data, loop=None):
         self.loop = loop or asyncio.get_event_loop()
         self.search_data = search_data
-        self.cache = ContentCache(self.search_data, self.loop)
+        self.cache = ContentCache(self.search_data, loop=self.loop)
         self.extractors = None
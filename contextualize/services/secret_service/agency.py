@@ -10,9 +10,9 @@ from functools import lru_cache
 from itertools import chain
 
 from contextualize.content.base import Extractable
+from contextualize.utils import tools
 from contextualize.utils.cache import AsyncCache
 from contextualize.utils.enum import FlexEnum
-from contextualize.utils.tools import PP
 
 BASE_DIRECTORY = '/'.join(__name__.split('.')[:-1])
 
@@ -70,7 +70,7 @@ class SecretService:
         try:
             return SecretAgent(**agent_kwargs)
         except Exception as e:
-            PP.pprint(dict(
+            tools.PP.pprint(dict(
                 msg='Unable to generate random agent; using default',
                 type='unable_to_generate_random_agent', error=e,
                 file_path=self.file_path, browser=self.browser, secret_service=repr(self)))
@@ -126,7 +126,7 @@ class SecretService:
             self.headers = list(agent.field_names())
             self.data[self.browser] = [list(agent.field_values())]
             self.read_data_file.cache_clear()
-            PP.pprint(dict(
+            tools.PP.pprint(dict(
                 msg='User agent data file missing, so using default; try acquire_data()',
                 type='user_agent_data_file_missing', error=e,
                 file_path=self.file_path, browser=self.browser,
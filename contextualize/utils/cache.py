@@ -8,6 +8,7 @@ from itertools import chain
 from functools import lru_cache
 
 import aioredis
+import hiredis
 import wrapt
 
 import settings
@@ -37,8 +38,10 @@ class AsyncCache(Singleton):
         loop = loop or self.loop or asyncio.get_event_loop()
         redis = self.client
         if not redis:
+            # Parse replies in C via hiredis rather than aioredis's pure-Python fallback
             redis = await aioredis.create_redis_pool(settings.REDIS_ADDRESS,
                                                      encoding=ENCODING_DEFAULT,
+                                                     parser=hiredis.Reader,
                                                      loop=loop)
             self.client = redis
         return redis
@@ -6,6 +6,7 @@ import inspect
 import wrapt
 from pprint import PrettyPrinter
 
+import settings
 from contextualize.utils.context import FlexContext
 from contextualize.utils.decor import factory_direct
 from contextualize.utils.tools import WIDTH
@@ -132,7 +133,15 @@ def debug(*args, offset=None, indent=4, extra=None):
                     for each level of offset
     extra=None:     String to be evaluated & printed as enter/exit info;
                     May reference `self`, `func`, `args`, or `kwargs`.
+
+    Unless settings.DEBUG is enabled, functions are returned unwrapped.
     """
+    if not settings.DEBUG:
+        def debug_decorator(func):
+            return func
+
+        return factory_direct(debug_decorator, *args)
+
     def debug_decorator(func):
 
         if asyncio.iscoroutinefunction(func):
@@ -1,5 +1,5 @@
 import os
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 
 
 class DirectoryScopedHTTPHandler(SimpleHTTPRequestHandler):
@@ -9,8 +9,16 @@ class DirectoryScopedHTTPHandler(SimpleHTTPRequestHandler):
         scoped_path = os.path.join(self.server.base_path, relative_path)
         return super().translate_path(scoped_path)
 
+    def copyfile(self, source, outputfile):
+        """Copy file to output, via zero-copy sendfile if to socket"""
+        if outputfile is not self.wfile:
+            return super().copyfile(source, outputfile)
+        outputfile.flush()
+        # Uses os.sendfile where supported, else falls back to send
+        self.connection.sendfile(source)
 
-class DirectoryScopedHTTPServer(HTTPServer):
+
+class DirectoryScopedHTTPServer(ThreadingHTTPServer):
     """Web server scoped to base_path within current working directory"""
     def __init__(self, server_address, handler_class=DirectoryScopedHTTPHandler, base_path='/'):
         self.base_path = base_path
@@ -1,6 +1,5 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
-from contextlib import contextmanager
 
 
 def read_file(path):
@@ -15,16 +14,31 @@ def write_file(path, content):
         file.write(content)
 
 
-@contextmanager
-def reset_files(*paths):
-    """Context manager that resets contents of specified file paths"""
-    initial_content = {path: None for path in paths}
-    for path in initial_content.keys():
-        initial_content[path] = read_file(path)
+class ResetFiles:
+    """
+    Reset Files
 
-    try:
-        yield initial_content.items()
+    Context manager that resets contents of specified file paths. A
+    plain class avoids the generator machinery of @contextmanager.
 
-    finally:
-        for path, content in initial_content.items():
+    I/O:
+    *paths:     file paths to be reset upon exit
+    return:     (path, initial content) items upon entry
+    """
+    def __init__(self, *paths):
+        self.paths = paths
+        self.initial_content = None
+
+    def __enter__(self):
+        """Enter context, reading initial content of all file paths"""
+        self.initial_content = {path: read_file(path) for path in self.paths}
+        return self.initial_content.items()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Exit context, writing initial content back to all file paths"""
+        for path, content in self.initial_content.items():
             write_file(path, content)
+        return False
+
+
+reset_files = ResetFiles
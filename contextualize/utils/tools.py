@@ -4,44 +4,132 @@ import ast
 import importlib
 import inspect
 import re
+import sys
+import textwrap
 from collections import OrderedDict
+from collections.abc import Iterable
 from contextlib import contextmanager
-from past.builtins import basestring
+from functools import lru_cache
 from pprint import PrettyPrinter
 from urllib.parse import urlparse
+from weakref import WeakKeyDictionary
 
-from parse import parse
+from parse import compile as compile_template
 
 from contextualize.exceptions import TooFewValuesError, TooManyValuesError
+from contextualize.utils.sentinel import Sentinel
 
 INDENT = 4
 WIDTH = 200
 
-PP = PrettyPrinter(indent=INDENT, width=WIDTH)
+STRING_TYPES = (str, bytes)
 
-CLASS_NAME_PATTERN = re.compile(r'[A-Z][a-zA-Z0-9]*$')
+MISSING = Sentinel()
 
+
+@lru_cache(maxsize=None)
+def _get_pretty_printer():
+    """Get pretty printer, constructed upon first use"""
+    return PrettyPrinter(indent=INDENT, width=WIDTH)
+
+
+def __getattr__(name):
+    """Lazily provide PP pretty printer upon first access (PEP 562)"""
+    if name == 'PP':
+        return _get_pretty_printer()
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+CLASS_NAME_PATTERN = re.compile(r'[A-Z][a-zA-Z0-9]*')
+
+@lru_cache(maxsize=4096)
 def is_class_name(name):
-    return CLASS_NAME_PATTERN.match(name)
+    return CLASS_NAME_PATTERN.fullmatch(name) is not None
 
 INTERPRETER_MODULE = '__main__'
-MODULE_NAME_PATTERN = re.compile(r'[a-z][a-z_0-9]*[a-z0-9]$')
+MODULE_NAME_PATTERN = re.compile(r'[a-z][a-z_0-9]*[a-z0-9]')
 
+@lru_cache(maxsize=4096)
 def is_module_name(name):
     if name == INTERPRETER_MODULE:
         return True
-    return MODULE_NAME_PATTERN.match(name)
+    return MODULE_NAME_PATTERN.fullmatch(name) is not None
+
+SELFISH_PARAMETER_NAMES = frozenset(('self', 'cls', 'meta'))
+
+@lru_cache(maxsize=1024)
+def _get_full_arg_spec(func):
+    return inspect.getfullargspec(func)
+
+
+@lru_cache(maxsize=1024)
+def _get_signature(func):
+    return inspect.signature(func)
 
-SELFISH_PARAMETER_NAMES = {'self', 'cls', 'meta'}
 
 def derive_args(func):
     """Derive args from the given function"""
-    args = inspect.getfullargspec(func).args
-    if args and is_selfish_name(args[0]):
+    try:
+        arg_spec = _get_full_arg_spec(func)
+    except TypeError:  # unhashable, e.g. method bound to unhashable instance
+        arg_spec = inspect.getfullargspec(func)
+    args = list(arg_spec.args)
+    if args and args[0] in SELFISH_PARAMETER_NAMES:
         del args[0]
     return args
 
 
+class InitAttributeVisitor(ast.NodeVisitor):
+    """
+    Init Attribute Visitor
+
+    Visit the AST of an __init__ method, collecting instance attributes
+    in declaration order and merging in super attributes wherever the
+    super __init__ is called.
+    """
+    def __init__(self, mro):
+        self.mro = mro
+        self.self_name = None
+        self.attributes = OrderedDict()
+
+    def visit_FunctionDef(self, node):
+        if self.self_name is None and node.args.args:
+            self.self_name = node.args.args[0].arg
+        self.generic_visit(node)
+
+    def visit_Assign(self, node):
+        for target in node.targets:
+            self._collect(target)
+        self.generic_visit(node)
+
+    def visit_AnnAssign(self, node):
+        self._collect(node.target)
+        self.generic_visit(node)
+
+    def visit_Call(self, node):
+        if len(self.mro) > 2 and self._is_super_init(node):  # No attributes on object class
+            super_attributes = derive_attributes(self.mro[1], self.mro[1:])
+            self.attributes.update(super_attributes)
+        self.generic_visit(node)
+
+    def _collect(self, target):
+        if isinstance(target, (ast.Tuple, ast.List)):
+            for element in target.elts:
+                self._collect(element)
+        elif (isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name) and
+                target.value.id == self.self_name):
+            self.attributes[target.attr] = None
+
+    @staticmethod
+    def _is_super_init(node):
+        func = node.func
+        return (isinstance(func, ast.Attribute) and func.attr == '__init__' and
+                isinstance(func.value, ast.Call) and
+                isinstance(func.value.func, ast.Name) and func.value.func.id == 'super')
+
+
+DERIVED_ATTRIBUTES_CACHE = WeakKeyDictionary()
+
 def derive_attributes(cls, _mro=None):
     """
     Derive attributes
@@ -54,51 +142,58 @@ def derive_attributes(cls, _mro=None):
     - attributes set in methods other than __init__
     - attributes set via setattr
     - attributes only conditionally set (they will always be included)
+
+    Results are cached per class and mro, as classes are not expected
+    to be redefined at runtime.
     """
     mro = cls.mro() if _mro is None else _mro
-    len_mro = len(mro)
-    attributes = OrderedDict()
+    # Key on ancestors only so cached values never reference cls itself
+    cache_key = tuple(mro[1:])
+    class_cache = DERIVED_ATTRIBUTES_CACHE.setdefault(cls, {})
 
     try:
-        lines = inspect.getsource(cls.__init__).split('\n')
+        attributes = class_cache[cache_key]
+        return list(attributes) if _mro is None else attributes
+    except KeyError:
+        pass
+
+    try:
+        source = inspect.getsource(cls.__init__)
 
     except TypeError:  # class definition does not contain __init__
-        if len_mro > 2:
+        attributes = OrderedDict()
+        if len(mro) > 2:
             super_attributes = derive_attributes(mro[1], mro[1:])
             attributes.update(super_attributes)
 
-        return attributes
-
-    for line in lines:
-        line = line.strip()
-        parsed = parse('self.{field} = {}', line)
+    else:
+        visitor = InitAttributeVisitor(mro)
+        visitor.visit(ast.parse(textwrap.dedent(source)))
+        attributes = visitor.attributes
 
-        if parsed is not None:
-            field = parsed.named['field']
-            attributes[field] = None
-            continue
-
-        if len_mro > 2:  # No attributes on object class
-            parsed = (parse('super().__init__({}', line) or
-                      parse(f'super({cls.__name__}, self).__init__({{}}', line))
-            if parsed is not None:
-                super_attributes = derive_attributes(mro[1], mro[1:])
-                attributes.update(super_attributes)
-
-    return [k for k in attributes] if _mro is None else attributes
+    class_cache[cache_key] = attributes
+    return list(attributes) if _mro is None else attributes
 
 
 def derive_domain(url, base=None):
     """Derive domain, even if no scheme; use base if relative url"""
-    parsed = urlparse(url)
-    if parsed.netloc:
-        return parsed.netloc
+    return _derive_domain(url, base)
 
+
+@lru_cache(maxsize=4096)
+def _derive_domain(url, base):
     try:
+        # urlparse only finds a netloc after '//', so skip it otherwise
+        has_netloc = '://' in url or url.startswith('//')
         url_start = url[0]
-    except (TypeError, IndexError):
+    except (TypeError, IndexError, AttributeError):
         raise ValueError(f'Invalid URL: {url}')
 
+    if has_netloc:
+        parsed = urlparse(url)
+        if parsed.netloc:
+            return parsed.netloc
+
     if url_start == '/':
         try:
             base_start = base[0]
@@ -108,7 +203,7 @@ def derive_domain(url, base=None):
         if base_start == '/':
             raise ValueError('Base may not be relative')
 
-        return derive_domain(url=base)
+        return _derive_domain(base, None)
 
     first_slash_index = url.find('/')
     if first_slash_index > 0:
@@ -126,15 +221,17 @@ def delist(obj):
     If obj is not a list, return the obj.
     If obj is a list with a single item, return the item.
     If obj is a list with 2 or more items, raise TooManyValuesError.
+
+    Only exact lists are unpacked; list subclasses are returned as is.
     """
-    if isinstance(obj, list):
-        if not obj:
-            return None
-        if len(obj) == 1:
-            return obj[0]
-        raise TooManyValuesError(expected=1, received=obj)
+    if type(obj) is not list:
+        return obj
 
-    return obj
+    if len(obj) == 1:
+        return obj[0]
+    if not obj:
+        return None
+    raise TooManyValuesError(expected=1, received=obj)
 
 
 def enlist(obj):
@@ -145,30 +242,34 @@ def enlist(obj):
     If obj is None, return an empty list.
     If obj is already a list, return the obj.
     If obj is not a list, return list containing obj.
+
+    Only exact lists are returned as is; list subclasses are wrapped.
     """
-    if obj is None:
-        return []
-    return obj if isinstance(obj, list) else [obj]
+    if type(obj) is list:
+        return obj
+    return [] if obj is None else [obj]
 
 
 def derive_qualname(obj):
     """Derive __qualname__; must be called on self from __init__"""
     classes = []
-    stack = frame = None
+    frame = None
     is_eligible = False
     try:
-        stack = inspect.stack()
-        for frame in stack:
-            if frame.function == '__call__':
+        # Walk frames directly; inspect.stack() also reads source context
+        frame = sys._getframe(1)
+        while frame is not None:
+            function = frame.f_code.co_name
+            if function == '__call__':
                 is_eligible = True
-            elif frame.function == '<module>':
+            elif function == '<module>':
                 break
             elif is_eligible:
-                if is_class_name(frame.function):
-                    classes.append(frame.function)
+                if is_class_name(function):
+                    classes.append(function)
+            frame = frame.f_back
     finally:
         del frame
-        del stack
 
     outer = '.'.join(reversed(classes))
     qualname = obj.__class__.__qualname__
@@ -214,7 +315,7 @@ def get_related_json(base, field, payload=None, strict=False):
             raise
         return
 
-    if isinstance(value, basestring):
+    if isinstance(value, STRING_TYPES):
         try:
             return payload[value]
         except (KeyError, TypeError):
@@ -222,15 +323,15 @@ def get_related_json(base, field, payload=None, strict=False):
                 raise
             return
 
-    if isinstance(value, list) and value and isinstance(value[0], basestring):
-        values = []
-        for element in value:
-            try:
-                values.append(payload[element])
-            except (KeyError, TypeError):
-                if strict:
-                    raise
-        return values
+    if isinstance(value, list) and value and isinstance(value[0], STRING_TYPES):
+        if strict:
+            return [payload[element] for element in value]
+        try:
+            payload_get = payload.get
+        except AttributeError:
+            return []
+        values = (payload_get(element, MISSING) for element in value)
+        return [v for v in values if v is not MISSING]
 
     return value
 
@@ -269,10 +370,10 @@ def is_namedtuple(obj):
     return isinstance(obj, tuple) and hasattr(obj, '_asdict')
 
 
-def is_nonstring_sequence(obj):
-    """Check if object is non-string sequence: list, tuple, range..."""
-    if (isinstance(obj, basestring) or hasattr(obj, 'items') or not hasattr(obj, '__getitem__')):
-        return False
+def _is_iterable(obj):
+    """Check if object is iterable, including via __getitem__ alone"""
+    if isinstance(obj, Iterable):
+        return True
     try:
         iter(obj)
         return True
@@ -280,14 +381,15 @@ def is_nonstring_sequence(obj):
         return False
 
 
+def is_nonstring_sequence(obj):
+    """Check if object is non-string sequence: list, tuple, range..."""
+    return (hasattr(obj, '__getitem__') and not isinstance(obj, STRING_TYPES) and
+            not hasattr(obj, 'items') and _is_iterable(obj))
+
+
 def is_packed(obj):
-    if isinstance(obj, str):
-        return False
-    try:
-        iter(obj)
-        return True
-    except TypeError:
-        return False
+    """Check if object is a non-string iterable"""
+    return not isinstance(obj, str) and _is_iterable(obj)
 
 
 def is_selfish_name(name):
@@ -325,27 +427,42 @@ def is_selfish(func, signature=None):
     try:
         return func.__self__ is not None
     except AttributeError:
-        signature = signature or inspect.signature(func)
+        if signature is None:
+            try:
+                signature = _get_signature(func)
+            except TypeError:  # unhashable
+                signature = inspect.signature(func)
         parameters = signature.parameters
         if not parameters:
             return False
         first = next(iter(parameters.keys()))
-        return is_selfish_name(first)
+        return first in SELFISH_PARAMETER_NAMES
 
 
-def load_class(specifier):
+def load_class(specifier, refresh=False):
     """
     Load Class
 
-    Load class based on the given specifier.
+    Load class based on the given specifier. Results are cached, so
+    repeated loads of the same specifier are dictionary lookups.
 
     I/O:
-    specifier:  absolute path to class, where an inner class can be
-                specified via dot notation:
-                module.path.to.OuterClass.InnerClass
-    return:     class object
-    raise:      ValueError if invalid specifier
+    specifier:      absolute path to class, where an inner class can be
+                    specified via dot notation:
+                    module.path.to.OuterClass.InnerClass
+    refresh=False:  if True, invalidate import caches and bypass cached
+                    results, e.g. when a module was created at runtime
+    return:         class object
+    raise:          ValueError if invalid specifier
     """
+    if refresh:
+        importlib.invalidate_caches()
+        return _load_class.__wrapped__(specifier)
+    return _load_class(specifier)
+
+
+@lru_cache(maxsize=256)
+def _load_class(specifier):
     module_names, class_names = [], []
     components = specifier.split('.')
 
@@ -363,9 +480,6 @@ def load_class(specifier):
         raise ValueError(f'Class specifier missing class: {specifier}')
 
     module_path = '.'.join(module_names)
-    first_class = class_names[0]
-
-    importlib.invalidate_caches()
     module = importlib.import_module(module_path)
 
     cls = module
@@ -378,18 +492,29 @@ def load_class(specifier):
     return cls
 
 
+def compile_templates(templates):
+    """Compile parse templates to parsers, cached by template sequence"""
+    return _compile_templates(tuple(templates))
+
+
+@lru_cache(maxsize=256)
+def _compile_templates(templates):
+    return tuple(compile_template(template) for template in templates)
+
+
 def multi_parse(templates, text):
     """
     Multi parse attempts to parse the text with each of the templates
-    until successful and returns the parse result.
+    until successful and returns the parse result. Templates are only
+    compiled upon first use of the given sequence.
 
     I/O:
     templates:      sequence of templates
     text:           string to be parsed
     return:         first successful parse result
     """
-    for template in templates:
-        parsed = parse(template, text)
+    for parser in compile_templates(templates):
+        parsed = parser.parse(text)
         if parsed:
             return parsed
 
@@ -399,6 +524,17 @@ def multi_parse(templates, text):
 
 def numify(text, default=object):
     """Convert text string to number, raising on error if no default"""
+    # Fast path for plain ints/floats, matching literal_eval semantics
+    if isinstance(text, str) and text.isascii():
+        digits = text[1:] if text[:1] in ('+', '-') else text
+        if digits.isdigit():
+            if digits[0] != '0' or not digits.strip('0'):  # no leading zeros
+                return int(text)
+        elif digits[:1].isdigit() and ('.' in digits or 'e' in digits or 'E' in digits):
+            try:
+                return float(text)
+            except ValueError:
+                pass
     try:
         return ast.literal_eval(text)
     except (SyntaxError, ValueError):
@@ -418,12 +554,28 @@ def represent(instance, *args, **kwargs):
     """
     arguments = []
     if args:
-        arguments.append(', '.join([f'{v!r}' for v in args]))
+        arguments.append(', '.join(map(repr, args)))
     if kwargs:
         arguments.append(', '.join([f'{k}={v!r}' for k, v in kwargs.items()]))
     return f"{instance.__class__.__name__}({', '.join(arguments)})"
 
 
+class PrettyMessage:
+    """
+    Pretty Message
+
+    Structured log message of the given fields, pretty formatted only
+    if and when the message is emitted by a log handler.
+    """
+    __slots__ = ('fields',)
+
+    def __init__(self, **fields):
+        self.fields = fields
+
+    def __str__(self):
+        return _get_pretty_printer().pformat(self.fields)
+
+
 def logical_xor(a, b):
     """Logical xor of a and b, returning bool"""
     return bool(a) ^ bool(b)
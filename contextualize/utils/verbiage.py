@@ -1,15 +1,24 @@
-import ast
 import contextlib
 import json
 import os
+import re
 import string
-from collections import OrderedDict
-from enum import Enum
+from bisect import bisect
+from functools import lru_cache
 from numbers import Number
 from string import Template
+from types import MappingProxyType
 
 import nltk
 
+from contextualize.utils.tools import MISSING, numify
+
+# Characters stripped from either end of the first word to be sounded
+LEADING_CHARACTERS = '$(`"\''
+TRAILING_CHARACTERS = ').!?:;-`"\''
+FIRST_WORD_PATTERN = re.compile(
+    f'[{re.escape(LEADING_CHARACTERS)}]*([^ ]*?)[{re.escape(TRAILING_CHARACTERS)}]*(?: |\\Z)')
+
 
 class PronunciationGuide:
 
@@ -56,14 +65,15 @@ class JsonFileMixin:
     """JSON File Mixin for basic read/write/removal of JSON files"""
     DIRECTORY_PATH = os.path.dirname(os.path.abspath(__file__))
     DIRECTORY_NAME = '.tmp'
+    BUFFER_SIZE = 64 * 1024
+    JSON_SEPARATORS = (',', ':')
 
     @classmethod
     def _read_file(cls, file_name):
         """Read JSON from file with given name and marshal to object"""
         file_path = os.path.join(cls.DIRECTORY_PATH, cls.DIRECTORY_NAME, file_name)
-        with open(file_path) as file:
-            content_json = file.read()
-        return json.loads(content_json)
+        with open(file_path, 'rb', buffering=cls.BUFFER_SIZE) as file:
+            return json.load(file)
 
     @classmethod
     def _write_file(cls, file_name, content):
@@ -71,9 +81,8 @@ class JsonFileMixin:
         directory_path = os.path.join(cls.DIRECTORY_PATH, cls.DIRECTORY_NAME)
         os.makedirs(directory_path, exist_ok=True)
         file_path = os.path.join(directory_path, file_name)
-        content_json = json.dumps(content, indent=4)
-        with open(file_path, 'w') as file:
-            file.write(content_json)
+        with open(file_path, 'w', buffering=cls.BUFFER_SIZE) as file:
+            json.dump(content, file, separators=cls.JSON_SEPARATORS)
 
     @classmethod
     def _remove_file(cls, file_name):
@@ -92,26 +101,26 @@ class FirstSoundGuide(JsonFileMixin, PronunciationGuide):
     Credit for nltk-based approach to determine vowel sounds:
     https://stackoverflow.com/a/20337527/4182210
 
-    Special cases are cached in files to avoid keeping entire dictionary
-    of pronunciations (currently over 123k words) in memory.
+    Special cases are cached in files as sorted JSON lists of words to
+    avoid keeping entire dictionary of pronunciations (currently over
+    123k words) in memory.
     """
     VOWELS = set('aeiou')
     CONSONANTS = set(string.ascii_lowercase) - VOWELS
+    LETTER_IS_VOWEL = {**dict.fromkeys(VOWELS, True), **dict.fromkeys(CONSONANTS, False)}
 
-    VOWEL_SOUNDING_CONSONANT_FILE = 'vowel_sounding_consonant_led_words.json'
-    CONSONANT_SOUNDING_VOWEL_FILE = 'consonant_sounding_vowel_led_words.json'
+    VOWEL_SOUNDING_CONSONANT_FILE = 'vowel_sounding_consonant_led_word_list.json'
+    CONSONANT_SOUNDING_VOWEL_FILE = 'consonant_sounding_vowel_led_word_list.json'
 
     def __init__(self):
         super().__init__()
         self._consonant_sounding_vowel_led_words = None
         self._vowel_sounding_consonant_led_words = None
 
+    @lru_cache(maxsize=4096)
     def led_by_vowel_sound(self, text):
-        """Determine if given text is led by a vowel sound"""
-        text = text.strip()
-        space_index = text.find(' ')
-        first_word = text[:space_index] if space_index > 0 else text
-        cleansed = first_word.lstrip('$(`"\'').rstrip(').!?:;-`"\'').lower()
+        """Determine if given text is led by a vowel sound; cached"""
+        cleansed = FIRST_WORD_PATTERN.match(text.strip()).group(1).lower()
 
         # Handle acronyms/initials
         period_index = cleansed.find('.')
@@ -123,23 +132,23 @@ class FirstSoundGuide(JsonFileMixin, PronunciationGuide):
         if hyphen_index > 0:
             cleansed = cleansed[:hyphen_index]
 
+        # Classify first letter as vowel (True), consonant (False), or neither (None)
+        is_vowel = self.LETTER_IS_VOWEL.get(cleansed[0])
+
         # Handle words starting with vowels
-        if cleansed[0] in self.VOWELS:
+        if is_vowel:
             return cleansed not in self.consonant_sounding_vowel_led_words
 
         # Handle words starting with consonants
-        elif cleansed[0] in self.CONSONANTS:
+        elif is_vowel is not None:
             return cleansed in self.vowel_sounding_consonant_led_words
 
         # Handle numeric
-        try:
-            # TODO: handle measures: $10k, $40M, $8B, 2.1T 10cc, 08:30am, 80%
-            cleansed = cleansed.replace(',', '')
-            ast.literal_eval(cleansed)
-            return cleansed[0] == '8' or (cleansed[:2] in {'11', '18'} and
-                                          (len(cleansed) % 3 == 2 or len(cleansed) == 4))
-        except (SyntaxError, ValueError):
-            return
+        # TODO: handle measures: $10k, $40M, $8B, 2.1T 10cc, 08:30am, 80%
+        digits = cleansed.replace(',', '')
+        if digits.replace('.', '', 1).isdigit():
+            return digits[0] == '8' or (digits[:2] in {'11', '18'} and
+                                        (len(digits) % 3 == 2 or len(digits) == 4))
 
     def first_sound(self, word):
         """Return first phoneme of a dictionary word"""
@@ -165,34 +174,42 @@ class FirstSoundGuide(JsonFileMixin, PronunciationGuide):
 
     @property
     def consonant_sounding_vowel_led_words(self):
-        """Return dict of words led by vowels that sound like consonants"""
+        """Return set of words led by vowels that sound like consonants"""
         if self._consonant_sounding_vowel_led_words is None:
             try:
-                pronunciations = self._read_file(self.CONSONANT_SOUNDING_VOWEL_FILE)
+                words = frozenset(self._read_file(self.CONSONANT_SOUNDING_VOWEL_FILE))
             except FileNotFoundError:
-                pronunciations = OrderedDict(
-                    (w, v) for w, v in self.dictionary.items()
-                    if w[0] in self.VOWELS and not self.first_sound_is_vowel(w))
-            if pronunciations:
-                self._consonant_sounding_vowel_led_words = pronunciations
-                self._write_file(self.CONSONANT_SOUNDING_VOWEL_FILE, pronunciations)
+                words = frozenset(w for w in self.dictionary
+                                  if w[0] in self.VOWELS and not self.first_sound_is_vowel(w))
+                if words:
+                    self._write_file(self.CONSONANT_SOUNDING_VOWEL_FILE, sorted(words))
+            if words:
+                self._consonant_sounding_vowel_led_words = words
+                self._deprovision_dictionary_if_cached()
         return self._consonant_sounding_vowel_led_words
 
     @property
     def vowel_sounding_consonant_led_words(self):
-        """Return dict of words led by consonants that sound like vowels"""
+        """Return set of words led by consonants that sound like vowels"""
         if self._vowel_sounding_consonant_led_words is None:
             try:
-                pronunciations = self._read_file(self.VOWEL_SOUNDING_CONSONANT_FILE)
+                words = frozenset(self._read_file(self.VOWEL_SOUNDING_CONSONANT_FILE))
             except FileNotFoundError:
-                pronunciations = OrderedDict(
-                    (w, v) for w, v in self.dictionary.items()
-                    if w[0] in self.CONSONANTS and self.first_sound_is_vowel(w))
-            if pronunciations:
-                self._vowel_sounding_consonant_led_words = pronunciations
-                self._write_file(self.VOWEL_SOUNDING_CONSONANT_FILE, pronunciations)
+                words = frozenset(w for w in self.dictionary
+                                  if w[0] in self.CONSONANTS and self.first_sound_is_vowel(w))
+                if words:
+                    self._write_file(self.VOWEL_SOUNDING_CONSONANT_FILE, sorted(words))
+            if words:
+                self._vowel_sounding_consonant_led_words = words
+                self._deprovision_dictionary_if_cached()
         return self._vowel_sounding_consonant_led_words
 
+    def _deprovision_dictionary_if_cached(self):
+        """Deprovision dictionary once all special cases are cached"""
+        if (self._consonant_sounding_vowel_led_words is not None and
+                self._vowel_sounding_consonant_led_words is not None):
+            self.deprovision_dictionary()
+
     def refresh_dictionary(self, corpus_name=None):
         """Refresh dictionary per given corpus name and clear cache"""
         super().refresh_dictionary(corpus_name)
@@ -203,6 +220,7 @@ class FirstSoundGuide(JsonFileMixin, PronunciationGuide):
         self.remove_cache_files()
         self._consonant_sounding_vowel_led_words = None
         self._vowel_sounding_consonant_led_words = None
+        self.__class__.led_by_vowel_sound.cache_clear()
 
     @classmethod
     def remove_cache_files(cls):
@@ -212,11 +230,13 @@ class FirstSoundGuide(JsonFileMixin, PronunciationGuide):
 
 
 FIRST_SOUND_GUIDE = FirstSoundGuide()
+# Bind once to skip the attribute lookup on each article rendered
+_led_by_vowel_sound = FIRST_SOUND_GUIDE.led_by_vowel_sound
 
 
 def a(text):
     """Prepend given text with proper indefinite article (a/an)"""
-    return f'an {text}' if FIRST_SOUND_GUIDE.led_by_vowel_sound(text) else f'a {text}'
+    return 'an ' + text if _led_by_vowel_sound(text) else 'a ' + text
 
 # Allow `an()` to be used interchangeably for improved readability
 an = a
@@ -224,6 +244,44 @@ an = a
 
 class ClearTemplate(Template):
     """String Template with improved str, repr and comparison support"""
+    def __init__(self, template):
+        super().__init__(template)
+        self._identifiers = self._derive_identifiers()
+
+    def _derive_identifiers(self):
+        """Derive placeholder names, longest first, if all are plain"""
+        identifiers = set()
+        for match in self.pattern.finditer(self.template):
+            identifier = match.group('named')
+            if identifier is None:  # escaped, braced, or invalid
+                return None
+            identifiers.add(identifier)
+        return tuple(sorted(identifiers, key=len, reverse=True))
+
+    def fast_substitute(self, mapping):
+        """
+        Fast substitute
+
+        Substitute plain placeholders via str.replace, falling back to
+        safe_substitute whenever replacement could differ: templates
+        with escaped/braced placeholders, values containing delimiters,
+        or unmapped placeholders extending a mapped one ($things/$thing).
+        """
+        identifiers = self._identifiers
+        if identifiers is None:
+            return self.safe_substitute(mapping)
+        delimiter = self.delimiter
+        rendered = self.template
+        for identifier in identifiers:  # longest first, so $things precedes $thing
+            if identifier in mapping:
+                value = str(mapping[identifier])
+                if delimiter in value:
+                    return self.safe_substitute(mapping)
+                rendered = rendered.replace(delimiter + identifier, value)
+            elif any(identifier.startswith(key) for key in mapping):
+                return self.safe_substitute(mapping)
+        return rendered
+
     def __str__(self):
         return self.template
 
@@ -241,6 +299,12 @@ class ClearTemplate(Template):
         return NotImplemented
 
 
+def _sort_template_formatters(template_map, assigner):
+    """Sort template map into parallel tuples of keys and formatters"""
+    formatter_keys = sorted((f'{k}{assigner}{v.template}', k) for k, v in template_map.items())
+    return tuple(k for _, k in formatter_keys), tuple(f for f, _ in formatter_keys)
+
+
 class Plurality:
     """
     Plurality
@@ -323,36 +387,43 @@ class Plurality:
     SINGULAR_TOKEN = 'thing'
     PLURAL_TOKEN = 'things'
 
+    # Article token as it leads a word in templates, built once
+    ARTICLE_PLACEHOLDER = f'${ARTICLE_TOKEN}'
+    ARTICLE_PREFIX = f'{ARTICLE_PLACEHOLDER} '
+
     TEMPLATE_CLASS = ClearTemplate
 
-    TEMPLATE_DEFAULTS = {
+    TEMPLATE_DEFAULTS = MappingProxyType({
         1: TEMPLATE_CLASS(f'${NUMBER_TOKEN} ${SINGULAR_TOKEN}'),  # '1=1 $thing'
         NUMBER_TOKEN: TEMPLATE_CLASS(f'${NUMBER_TOKEN} ${PLURAL_TOKEN}')  # 'n=$n $things'
-    }
-
-    class Formatter(Enum):
-        NUMBER = 'number_formatter'
-        FORM = 'form_formatter'
-        TEMPLATE = 'template_formatter'
-
-    class CustomFormatter(Enum):
-        NUMBER = 'number_formatter'
-        FORM = 'form_formatter'
-        TEMPLATE = 'custom_template_formatter'
+    })
+    TEMPLATE_KEYS_DEFAULT, TEMPLATE_FORMATTERS_DEFAULT = _sort_template_formatters(
+        TEMPLATE_DEFAULTS, TEMPLATE_ASSIGNER)
 
     def __init__(self, *args):
         super().__init__()
         self.number = None
         self.singular = None
         self.plural = None
+        self._form_formatter = None
         self.template_map = self.TEMPLATE_DEFAULTS
+        self._templates_owned = False
+        self._template_keys = self.TEMPLATE_KEYS_DEFAULT
+        self._template_formatters = self.TEMPLATE_FORMATTERS_DEFAULT
+        self._reset_template_cache()
         self._configure_from_args(*args)
 
     def clone(self, deep=False):
         """Clone instance with shared templates unless deep is True"""
         inst = self.__class__()
         inst.number, inst.singular, inst.plural = self.number, self.singular, self.plural
+        inst._form_formatter = self._form_formatter
         inst.template_map = self.template_map.copy() if deep else self.template_map
+        # Shared templates are copied on write by whichever instance writes first
+        inst._templates_owned = deep
+        self._templates_owned = self._templates_owned and deep
+        inst._template_keys = self._template_keys
+        inst._template_formatters = self._template_formatters
         return inst
 
     def clone_with(self, *args, deep=False, override=True):
@@ -397,33 +468,57 @@ class Plurality:
             kwargs[self.PLURAL_TOKEN] = self.plural
 
         template = self.get_template()
-        rendered = template.safe_substitute(**kwargs)
+        rendered = template.fast_substitute(kwargs)
 
-        if f'${self.ARTICLE_TOKEN} ' in rendered:
+        if self.ARTICLE_PREFIX in rendered:
             return self._render_articles(rendered)
         return rendered
 
     def get_template(self, number=None):
         """Get template based on given number, defaulting to current"""
         number = number if number is not None else self.number
-        return self.template_map.get(number, self.template_map[self.NUMBER_TOKEN])
+        if number == self._template_number:
+            return self._template
+        template_map = self.template_map
+        template = template_map.get(number, template_map[self.NUMBER_TOKEN])
+        self._template_number, self._template = number, template
+        return template
+
+    def _reset_template_cache(self):
+        """Reset template cached by get_template for the last number"""
+        self._template_number = MISSING
+        self._template = None
 
     def _render_articles(self, template):
         """Render all article tokens in the given template"""
-        article_token = f'${self.ARTICLE_TOKEN}'
-        words = template.split(' ')
-
-        for i, word in enumerate(words):
-            if word != article_token:
+        article_token = self.ARTICLE_PLACEHOLDER
+        if template == article_token or template.endswith(f' {article_token}'):
+            raise ValueError(f'Each article token ($a) must precede a word: {template}')
+
+        token = self.ARTICLE_PREFIX
+        token_length = len(token)
+        rendered = []
+        position = 0
+        index = template.find(token)
+
+        while index >= 0:
+            word_start = index + token_length
+            # Only whole-word tokens count, so skip any embedded in a word
+            if index and template[index - 1] != ' ':
+                index = template.find(token, index + 1)
                 continue
-            try:
-                next_word = words[i + 1]
-            except IndexError:
-                raise ValueError(f'Each article token ($a) must precede a word: {template}')
-            article = 'an' if FIRST_SOUND_GUIDE.led_by_vowel_sound(next_word) else 'a'
-            words[i] = article
-
-        return ' '.join(words)
+            word_end = template.find(' ', word_start)
+            next_word = template[word_start:] if word_end < 0 else template[word_start:word_end]
+            article = 'an' if _led_by_vowel_sound(next_word) else 'a'
+            rendered.append(template[position:index])
+            rendered.append(article)
+            position = word_start - 1
+            index = template.find(token, word_start)
+
+        if not rendered:
+            return template
+        rendered.append(template[position:])
+        return ''.join(rendered)
 
     def __add__(self, other):
         """Cast to string when added to a string from the left"""
@@ -452,6 +547,8 @@ class Plurality:
         """Format instance by passing args as a ;-delimited string"""
         if not formatter:
             return str(self)
+        if self.FORMATTER_DELIMITER not in formatter:
+            return str(self(self._deformat(formatter)))
         substrings = formatter.split(self.FORMATTER_DELIMITER)
         args = (self._deformat(substring) for substring in substrings)
         return str(self(*args))
@@ -469,7 +566,8 @@ class Plurality:
     @property
     def formatters(self):
         """Construct list of formatters for current configuration"""
-        return self._build_formatters(self.Formatter)
+        formatters = (self.number_formatter, self.form_formatter, self.template_formatter)
+        return [formatter for formatter in formatters if formatter]
 
     @property
     def custom_formatter(self):
@@ -479,17 +577,8 @@ class Plurality:
     @property
     def custom_formatters(self):
         """Construct list of formatters, excluding default templates"""
-        return self._build_formatters(self.CustomFormatter)
-
-    def _build_formatters(self, formatter_enum):
-        """Construct list of formatters given a formatter enum"""
-        formatters = []
-        formatter_names = (formatter_option.value for formatter_option in formatter_enum)
-        for formatter_name in formatter_names:
-            formatter = getattr(self, formatter_name)
-            if formatter:
-                formatters.append(formatter)
-        return formatters
+        formatters = (self.number_formatter, self.form_formatter, self.custom_template_formatter)
+        return [formatter for formatter in formatters if formatter]
 
     @property
     def number_formatter(self):
@@ -503,22 +592,8 @@ class Plurality:
 
     @property
     def form_formatter(self):
-        """Construct form formatter from singular/plural values"""
-        singular, plural = self.singular, self.plural
-        if not singular or not plural:
-            return
-        if singular == plural:
-            return singular
-        if plural.startswith(singular):
-            plural_suffix = plural[len(singular)-len(plural):]
-            return f'{singular}{self.FORM_DELIMITER}{plural_suffix}'
-        for i in range(0, len(singular) - 1):
-            if singular[i] != plural[i]:
-                break
-        base = singular[:i]
-        singular_suffix = singular[i:]
-        plural_suffix = plural[i:]
-        return f'{base}{self.FORM_DELIMITER}{singular_suffix}{self.FORM_DELIMITER}{plural_suffix}'
+        """Form formatter derived from singular/plural values"""
+        return self._form_formatter
 
     @property
     def templates(self):
@@ -533,8 +608,7 @@ class Plurality:
     @property
     def template_formatters(self):
         """Construct sorted list of template formatters"""
-        return sorted(f'{k}{self.TEMPLATE_ASSIGNER}{v.template}'
-                      for k, v in self.template_map.items())
+        return list(self._template_formatters)
 
     @property
     def custom_templates(self):
@@ -549,8 +623,8 @@ class Plurality:
     @property
     def custom_template_formatters(self):
         """Construct sorted list of template formatters, excluding defaults"""
-        return sorted(f'{k}{self.TEMPLATE_ASSIGNER}{v.template}'
-                      for k, v in self.custom_template_items)
+        return [f for k, f in zip(self._template_keys, self._template_formatters)
+                if not self.is_default_template(k)]
 
     @property
     def custom_template_map(self):
@@ -579,23 +653,17 @@ class Plurality:
             return formatter
         if self.FORM_DELIMITER in formatter:
             return formatter
-        try:
-            return ast.literal_eval(formatter)
-        except ValueError:
-            return formatter
+        return numify(formatter, formatter)
 
     def _configure_from_args(self, *args, override=False):
         """Configure instance from given args"""
-        templates_copied = number_configured = forms_configured = False
+        number_configured = forms_configured = False
         for arg in args:
             if isinstance(arg, Number):
                 self._configure_number(arg, number_configured, override)
                 number_configured = True
             elif isinstance(arg, str):
                 if self.is_template_formatter(arg):
-                    if not templates_copied:
-                        self.template_map = self.template_map.copy()
-                        templates_copied = True
                     self._configure_templates(arg)
                 else:
                     self._configure_forms(arg, forms_configured, override)
@@ -608,18 +676,39 @@ class Plurality:
         if is_configured or (not override and self.number is not None):
             raise ValueError('Number has already been configured')
         self.number = number
+        self._reset_template_cache()
 
     def _configure_templates(self, formatter):
         """Configure instance with given template formatter"""
         if formatter:
+            if not self._templates_owned:
+                self.template_map = dict(self.template_map)
+                self._templates_owned = True
             for sub_formatter in formatter.split(self.FORMATTER_DELIMITER):
                 try:
                     key, value = sub_formatter.split(self.TEMPLATE_ASSIGNER)
                 except ValueError:
                     raise ValueError(f'Invalid template formatter: {sub_formatter!r}')
-                if key != self.NUMBER_TOKEN:
-                    key = ast.literal_eval(key)
-                self.template_map[key] = self.TEMPLATE_CLASS(value)
+                if key == self.NUMBER_TOKEN:
+                    key = self.NUMBER_TOKEN  # reuse interned token for identity hits
+                else:
+                    key = numify(key)
+                template = self.template_map[key] = self.TEMPLATE_CLASS(value)
+                self._index_template(key, template)
+            self._reset_template_cache()
+
+    def _index_template(self, key, template):
+        """Index template formatter by key, keeping formatters sorted"""
+        keys, formatters = list(self._template_keys), list(self._template_formatters)
+        if key in keys:
+            index = keys.index(key)
+            key = keys.pop(index)  # retain original key, e.g. 1 when given 1.0
+            del formatters[index]
+        formatter = f'{key}{self.TEMPLATE_ASSIGNER}{template.template}'
+        index = bisect(formatters, formatter)
+        keys.insert(index, key)
+        formatters.insert(index, formatter)
+        self._template_keys, self._template_formatters = tuple(keys), tuple(formatters)
 
     def _configure_forms(self, formatter, is_configured=False, override=False):
         """Configure instance with given (singular/plural) form formatter"""
@@ -627,6 +716,7 @@ class Plurality:
         if is_configured or (not override and (self.singular or self.plural)):
             raise ValueError('Singular/plural forms have already been configured')
         self.singular, self.plural = singular, plural
+        self._form_formatter = self._derive_form_formatter(singular, plural)
 
     def _derive_forms(self, formatter):
         """Derive singular and plural forms from form formatter"""
@@ -635,3 +725,16 @@ class Plurality:
         singular = base + singular_suffix
         plural = base + plural_suffix
         return singular, plural
+
+    def _derive_form_formatter(self, singular, plural):
+        """Derive form formatter from singular and plural forms"""
+        if not singular or not plural:
+            return
+        if singular == plural:
+            return singular
+        delimiter = self.FORM_DELIMITER
+        if plural.startswith(singular):
+            return f'{singular}{delimiter}{plural[len(singular):]}'
+        base = os.path.commonprefix((singular, plural))
+        i = len(base)
+        return f'{base}{delimiter}{singular[i:]}{delimiter}{plural[i:]}'
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import asyncio
+import logging
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from itertools import chain
+
+from contextualize.utils.asynchronous import run_in_executor
+from contextualize.utils.tools import PrettyMessage
+
+logger = logging.getLogger(__name__)
+
+
+class WebDriverPool:
+    """
+    WebDriverPool
+
+    Pool of warm web drivers keyed by web driver type, so drivers may be
+    reused across extractions rather than spawned for each. Drivers are
+    checked out as needed; checking out never waits, as extractors may
+    hold one driver while their sources check out others. Upon check-in,
+    drivers are reset and kept idle for reuse, up to maxsize per type;
+    surplus drivers are quit. Idle drivers are only quit on close.
+
+    I/O:
+    provision:      Coroutine function accepting web_driver_type & loop
+                    keyword arguments that provisions a web driver
+
+    deprovision:    Coroutine function accepting web_driver & loop
+                    keyword arguments that deprovisions a web driver
+
+    maxsize=None:   Maximum number of idle web drivers kept per type;
+                    default: MAXSIZE_DEFAULT
+    """
+    MAXSIZE_DEFAULT = 4
+    BLANK_URL = 'about:blank'
+
+    @asynccontextmanager
+    async def acquire(self, web_driver_type, loop=None):
+        """Acquire web driver as context manager, checking in upon exit"""
+        web_driver = await self.checkout(web_driver_type, loop=loop)
+        try:
+            yield web_driver
+        finally:
+            await self.checkin(web_driver, loop=loop)
+
+    async def checkout(self, web_driver_type, loop=None):
+        """Check out idle web driver of given type, else provision one"""
+        idle_web_drivers = self._idle_web_drivers[web_driver_type]
+        if idle_web_drivers:
+            return idle_web_drivers.pop()
+        return await self.provision(web_driver_type=web_driver_type, loop=loop)
+
+    async def checkin(self, web_driver, loop=None):
+        """Check in web driver, resetting it for reuse unless surplus"""
+        if not web_driver:
+            return
+        idle_web_drivers = self._idle_web_drivers[type(web_driver)]
+        if len(idle_web_drivers) < self.maxsize:
+            try:
+                await self._reset_web_driver(web_driver, loop)
+            except Exception as e:
+                logger.error(PrettyMessage(
+                    msg='Web driver reset failure', type='web_driver_reset_failure',
+                    error=e, web_driver=web_driver))
+            else:
+                # Check again as other drivers may be checked in during reset
+                if len(idle_web_drivers) < self.maxsize:
+                    idle_web_drivers.append(web_driver)
+                    return
+
+        await self.deprovision(web_driver=web_driver, loop=loop)
+
+    async def close(self, loop=None):
+        """Close pool by deprovisioning all idle web drivers"""
+        idle_web_drivers = list(chain.from_iterable(self._idle_web_drivers.values()))
+        self._idle_web_drivers.clear()
+        await asyncio.gather(*(self.deprovision(web_driver=web_driver, loop=loop)
+                               for web_driver in idle_web_drivers))
+
+    async def _reset_web_driver(self, web_driver, loop=None):
+        """Reset web driver by clearing cookies and navigating to blank page"""
+        loop = loop or asyncio.get_event_loop()
+        await run_in_executor(loop, None, web_driver.delete_all_cookies)
+        await run_in_executor(loop, None, web_driver.get, self.BLANK_URL)
+        # Delays are only necessary between fetches from the same domain
+        web_driver.last_fetch_timestamp = None
+
+    def __len__(self):
+        return sum(len(web_drivers) for web_drivers in self._idle_web_drivers.values())
+
+    def __init__(self, provision, deprovision, maxsize=None):
+        self.provision = provision
+        self.deprovision = deprovision
+        self.maxsize = self.MAXSIZE_DEFAULT if maxsize is None else maxsize
+        self._idle_web_drivers = defaultdict(list)  # idle web drivers by type
+
+    def __repr__(self):
+        class_name = self.__class__.__name__
+        return f'<{class_name}: {len(self)} idle, maxsize={self.maxsize}>'
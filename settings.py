@@ -1,7 +1,11 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import os
 from collections import namedtuple
 
+# Set CONTEXTUALIZE_DEBUG=1 (or true/yes) in the environment to enable @debug output
+DEBUG = os.environ.get('CONTEXTUALIZE_DEBUG', '').lower() in {'1', 'true', 'yes'}
+
 WebAddress = namedtuple('WebAddress', 'host port')
 
 REDIS_ADDRESS = 'redis://localhost'
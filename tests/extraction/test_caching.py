@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from contextualize.extraction.caching import MultiExtractorCache
+from contextualize.extraction.definitions import ExtractionStatus
+
+
+class FakeClient:
+
+    async def hgetall(self, key):
+        self.reads += 1
+        await asyncio.sleep(0)
+        return dict(self.info_hash)
+
+    async def hmset_dict(self, key, info_hash):
+        self.info_hash = info_hash
+
+    def __init__(self):
+        self.reads = 0
+        self.info_hash = {}
+
+
+def create_cache(client):
+    cache = MultiExtractorCache(directory='a_com', search_data={'query': 'q'},
+                                cache_version=None, loop=asyncio.get_event_loop())
+    cache.core = Mock(client=client)
+    return cache
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'idx, ttl, concurrent, check',
+    [(0,  60,  False,      1),
+     (1,  0,   False,      2),
+     (2,  0,   True,       1),
+     ])
+async def test_retrieve_extraction_info_reuses_reads(monkeypatch, idx, ttl, concurrent, check):
+    """Test extraction info reads are reused within the TTL and while in flight"""
+    monkeypatch.setattr(MultiExtractorCache, 'INFO_CACHE_TTL', ttl)
+    client = FakeClient()
+    cache = create_cache(client)
+
+    if concurrent:
+        infos = await asyncio.gather(cache.retrieve_extraction_info(),
+                                     cache.retrieve_extraction_info())
+    else:
+        infos = [await cache.retrieve_extraction_info(),
+                 await cache.retrieve_extraction_info()]
+
+    assert client.reads == check
+    assert (infos[0] is infos[1]) is (check == 1)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_store_extraction_info_invalidates_reads(monkeypatch):
+    """Test storing extraction info invalidates recent reads"""
+    monkeypatch.setattr(MultiExtractorCache, 'INFO_CACHE_TTL', 60)
+    client = FakeClient()
+    cache = create_cache(client)
+
+    info = await cache.retrieve_extraction_info()
+    assert info.status is None
+
+    await cache.store_extraction_info(ExtractionStatus.COMPLETED)
+    info = await cache.retrieve_extraction_info()
+    assert info.status is ExtractionStatus.COMPLETED
+    assert client.reads == 2
@@ -1,10 +1,11 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 from collections import OrderedDict
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
+from contextualize.extraction import configuration as configuration_module
 from contextualize.extraction.configuration import (
     ExtractorConfiguration, MultiExtractorConfiguration, SourceExtractorConfiguration
 )
@@ -33,3 +34,21 @@ def test_extractor_configuration(idx, file_path, check):
     else:
         configuration = ExtractorConfiguration.from_file(file_path, extractor=mock_extractor)
         assert isinstance(configuration, check)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'idx, file_path,                                             extractor_count',
+    [(0,  'contextualize/providers/academic_oup_com/multi.yaml',  3),
+     (1,  'contextualize/providers/ncbi_nlm_nih_gov/source.yaml', 3),
+     ])
+def test_extractor_configuration_file_parsed_once(idx, file_path, extractor_count):
+    """Test Extractor Configuration file is parsed once across extractors"""
+    ExtractorConfiguration.file_cache.lyrical_cache.invalidate(file_path)
+    yaml = configuration_module.yaml
+    with patch.object(yaml, 'load', wraps=yaml.load) as mock_load:
+        for _ in range(extractor_count):
+            mock_extractor = Mock()
+            mock_extractor.page_url = 'page_url'
+            ExtractorConfiguration.from_file(file_path, extractor=mock_extractor)
+    assert mock_load.call_count == 1
@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import pytest
+
+from contextualize.extraction.definitions import ExtractionStatus as ES
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'idx, statuses,                                         check',
+    [(0,  (),                                               None),
+     (1,  (None, None),                                     None),
+     (2,  (ES.FAILURE, ES.FAILURE),                         ES.FAILURE),
+     (3,  (ES.FAILURE, ES.EMPTY, None),                     ES.EMPTY),
+     (4,  (ES.EMPTY, ES.INITIATED, ES.FAILURE),             ES.INITIATED),
+     (5,  (ES.INITIATED, ES.COMPLETED),                     ES.PRELIMINARY),
+     (6,  (ES.FAILURE, ES.PRELIMINARY, ES.INITIATED),       ES.PRELIMINARY),
+     (7,  (ES.COMPLETED, ES.COMPLETED),                     ES.COMPLETED),
+     (8,  (ES.COMPLETED, None),                             ES.COMPLETED),
+     (9,  ('COMPLETED', 4),                                 ES.PRELIMINARY),
+     ])
+def test_extraction_status_aggregate(idx, statuses, check):
+    """Test extraction status aggregate produces overall status"""
+    assert ES.aggregate(*statuses) is check
@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import asyncio
+import os
+from unittest.mock import Mock
+
+import pytest
+from url_normalize import url_normalize
+
+from contextualize.content.research_article import ResearchArticle
+from contextualize.extraction.configuration import ExtractorConfiguration
+from contextualize.extraction.extractor import MultiExtractor, SourceExtractor
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'idx, url,                                              check',
+    [(0,  'https://www.ncbi.nlm.nih.gov/pmc/PMC123/',       'ncbi.nlm.nih.gov/pmc/PMC123'),
+     (1,  'http://ncbi.nlm.nih.gov/pmc/PMC123',             'ncbi.nlm.nih.gov/pmc/PMC123'),
+     (2,  'https://academic.oup.com/ajh/1/2?searchresult=1', 'academic.oup.com/ajh/1/2'),
+     (3,  'https://academic.oup.com/ajh/1/2#abstract',      'academic.oup.com/ajh/1/2'),
+     (4,  'www.jurn.org/papers/',                           'jurn.org/papers'),
+     (5,  '//www.jurn.org',                                 'jurn.org'),
+     (6,  'https://example.com/www.example.com/',           'example.com/www.example.com'),
+     ])
+def test_clip_url(idx, url, check):
+    """Test clip url reduces URL to host sans www and path"""
+    assert SourceExtractor._clip_url(url) == check
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_extract_in_parallel_cancels_stragglers(monkeypatch):
+    """Test extract in parallel skips failed domains and cancels hung ones"""
+    cancelled = []
+
+    async def extract_in_series(model, urls, **kwds):
+        if urls == ['hung']:
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.extend(urls)
+                raise
+        if urls == ['failed']:
+            raise RuntimeError('Extraction failed')
+        await asyncio.sleep(0.02)
+        return urls
+
+    # Domains run one at a time, so later ones queue beyond the timeout
+    monkeypatch.setattr(SourceExtractor, 'MAX_PARALLEL_DOMAINS', 1)
+    monkeypatch.setattr(SourceExtractor, 'PARALLEL_EXTRACTION_TIMEOUT', 0.05)
+    monkeypatch.setattr(SourceExtractor, 'extract_in_series', extract_in_series)
+    monkeypatch.setattr(SourceExtractor, '_derive_web_driver_brand',
+                        lambda web_driver_type: SourceExtractor.WEB_DRIVER_BRAND_DEFAULT)
+
+    urls_by_domain = {'a.com': ['a1', 'a2'],
+                      'hung.com': ['hung'],
+                      'failed.com': ['failed'],
+                      'b.com': ['b1']}
+
+    source_results = await SourceExtractor.extract_in_parallel(
+        model=None, urls_by_domain=urls_by_domain, search_domain='a.com',
+        search_web_driver=None, use_cache=False)
+
+    assert source_results == ['a1', 'a2', 'b1']
+    assert cancelled == ['hung']
+
+
+class FakeWebDriverPool:
+
+    async def checkout(self, web_driver_type, loop=None):
+        return self.web_driver
+
+    async def checkin(self, web_driver, loop=None):
+        self.checked_in.append(web_driver)
+
+    async def deprovision(self, web_driver, loop=None):
+        self.deprovisioned.append(web_driver)
+
+    def __init__(self, web_driver):
+        self.web_driver = web_driver
+        self.checked_in = []
+        self.deprovisioned = []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'idx, error,                     checked_in, deprovisioned',
+    [(0,  None,                      1,          0),
+     (1,  RuntimeError,              0,          1),
+     (2,  asyncio.CancelledError,    0,          1),
+     ])
+async def test_extract_in_series_releases_web_driver(idx, error, checked_in, deprovisioned,
+                                                     monkeypatch):
+    """Test extract in series pools its web driver, unless extraction fails"""
+    web_driver = Mock()
+    web_driver_pool = FakeWebDriverPool(web_driver)
+
+    async def extract():
+        if error:
+            raise error
+        return 'content'
+
+    source_extractor = Mock(extract=extract)
+    monkeypatch.setattr(SourceExtractor, 'web_driver_pool', web_driver_pool)
+    monkeypatch.setattr(SourceExtractor, 'provision_extractors',
+                        lambda **kwds: iter([source_extractor]))
+
+    if error:
+        with pytest.raises(error):
+            await SourceExtractor.extract_in_series(model=None, urls=['a1'], use_cache=False)
+    else:
+        source_results = await SourceExtractor.extract_in_series(model=None, urls=['a1'],
+                                                                 use_cache=False)
+        assert source_results == ['content']
+
+    web_driver.implicitly_wait.assert_called_once_with(ExtractorConfiguration.IMPLICIT_WAIT_DEFAULT)
+    assert web_driver_pool.checked_in == [web_driver] * checked_in
+    assert web_driver_pool.deprovisioned == [web_driver] * deprovisioned
+
+
+@pytest.mark.unit
+def test_find_configured_directories(tmp_path, monkeypatch):
+    """Test configured directories are cached until a directory changes"""
+    monkeypatch.setattr(MultiExtractor, '_configured_directories', {})
+    base = str(tmp_path)
+    file_name = MultiExtractor.FILE_NAME
+    for directory in ('a_com', 'b_org/search', 'c_net'):
+        (tmp_path / directory).mkdir(parents=True)
+    for directory in ('a_com', 'b_org/search'):
+        (tmp_path / directory / file_name).touch()
+
+    directories = MultiExtractor._find_configured_directories(base)
+    assert sorted(directories) == ['a_com', 'b_org/search']
+    assert MultiExtractor._find_configured_directories(base) is directories
+
+    (tmp_path / 'c_net' / file_name).touch()
+    directories = MultiExtractor._find_configured_directories(base)
+    assert sorted(directories) == ['a_com', 'b_org/search', 'c_net']
+
+
+@pytest.mark.unit
+def test_find_directory(tmp_path, monkeypatch):
+    """Test source directory lookups are cached until a checked directory changes"""
+    monkeypatch.setattr(SourceExtractor, '_source_directories', {})
+    base = str(tmp_path)
+    file_name = SourceExtractor.FILE_NAME
+    (tmp_path / 'a_com' / 'pmc' / 'articles').mkdir(parents=True)
+    (tmp_path / 'a_com' / file_name).touch()
+    path_components = ('a_com', 'pmc', 'articles', 'PMC123')
+
+    assert SourceExtractor._find_directory(base, path_components) == 'a_com'
+    assert SourceExtractor._find_directory(base, path_components) == 'a_com'
+
+    (tmp_path / 'a_com' / 'pmc' / file_name).touch()
+    assert SourceExtractor._find_directory(base, path_components) == 'a_com/pmc'
+
+    (tmp_path / 'a_com' / 'pmc' / file_name).unlink()
+    (tmp_path / 'a_com' / 'pmc' / 'articles' / 'PMC123').mkdir()
+    (tmp_path / 'a_com' / 'pmc' / 'articles' / 'PMC123' / file_name).touch()
+    assert SourceExtractor._find_directory(base, path_components) == 'a_com/pmc/articles/PMC123'
+
+    assert SourceExtractor._find_directory(base, ('b_org',)) is None
+    assert SourceExtractor._find_directory(os.path.join(base, 'missing'), ('b_org',)) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_combine_results():
+    """Test combine results overrides item fields with non-null source fields"""
+    url = 'https://example.com/article'
+    content = ResearchArticle(source_url=url, rank=1, title='Item Title', doi='10.1/item')
+    source_content = ResearchArticle(source_url=url, title='Source Title', summary='Summary')
+
+    await MultiExtractor._combine_results(Mock(), {url: content}, {url: source_content})
+
+    assert content.title == 'Source Title'
+    assert content.summary == 'Summary'
+    assert content.doi == '10.1/item'
+    assert content.rank == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_extract_sources_coalesces_cohort(monkeypatch):
+    """Test extract sources extracts each source URL once per cohort"""
+    extracted_urls = []
+
+    async def extract_in_parallel(model, urls_by_domain, **kwds):
+        urls = [url for domain_urls in urls_by_domain.values() for url in domain_urls]
+        extracted_urls.extend(urls)
+        await asyncio.sleep(0)
+        # Source extractors normalize their page URLs
+        return [ResearchArticle(source_url=url_normalize(url), title=url_normalize(url))
+                for url in urls if 'failed' not in url]
+
+    monkeypatch.setattr(SourceExtractor, 'extract_in_parallel', extract_in_parallel)
+
+    loop = asyncio.get_event_loop()
+    source_extractions = {}
+    extractors = [Mock(page_url=f'https://search{i}.com/', loop=loop,
+                       _source_extractions=source_extractions) for i in range(2)]
+    # URLs found by both extractors only match once normalized
+    url_lists = [['https://a.com/1', 'https://b.com/2', 'https://d.com/~x',
+                  'https://failed.com/3'],
+                 ['HTTPS://B.COM/2', 'https://c.com/4', 'https://d.com/%7Ex',
+                  'https://failed.com/3']]
+    extracted_contents = [{url: ResearchArticle(source_url=url) for url in urls}
+                          for urls in url_lists]
+
+    source_results = await asyncio.gather(
+        *(MultiExtractor._extract_sources(extractor, extracted_content)
+          for extractor, extracted_content in zip(extractors, extracted_contents)))
+
+    assert len(extracted_urls) == 5
+    assert len({url_normalize(url) for url in extracted_urls}) == 5
+
+    for extractor, urls, extracted_content, results in zip(
+            extractors, url_lists, extracted_contents, source_results):
+        assert sorted(results) == sorted(url for url in urls if 'failed' not in url)
+        await MultiExtractor._combine_results(extractor, extracted_content, results)
+        for url in results:
+            assert extracted_content[url].title == url_normalize(url)
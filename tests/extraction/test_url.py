@@ -138,3 +138,20 @@ def test_url_constructor(idx, configuration, search_data, check):
         url_constructor = URLConstructor.from_dict(configuration)
         url = url_constructor.construct(search_data)
         assert url == check
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'idx, template,                         literals_check,                tokens_check',
+    [(0,  'http://www.example.com',         ('http://www.example.com',),   ()),
+     (1,  '{index}',                        ('', ''),                      ('index',)),
+     (2,  'a={term}&b={index}',             ('a=', '&b=', ''),             ('term', 'index')),
+     (3,  'qb={{query}}',                   ('qb={', '}'),                 ('query',)),
+     (4,  '{term}+{term}',                  ('', '+', ''),                 ('term', 'term')),
+     ])
+def test_compile_url_template(idx, template, literals_check, tokens_check):
+    """Test compile splits template into literals and innermost tokens"""
+    literals, tokens = URLConstructor._compile(template)
+    assert literals == literals_check
+    assert tokens == tokens_check
+    assert tuple(URLConstructor._find_tokens(template)) == tokens_check
@@ -1,16 +1,67 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import logging
+
 import pytest
 
 from contextualize.exceptions import TooManyValuesError
 
 
 from contextualize.utils.tools import (
-    derive_domain, delist, enlist, get_related_json, is_child_class, is_instance_method,
-    is_class_method, is_static_method, is_selfish, logical_xor, xor_constrain
+    derive_args, derive_attributes, derive_domain, delist, enlist, get_related_json,
+    is_child_class, is_instance_method, is_class_method, is_class_name, is_module_name,
+    is_nonstring_sequence, is_packed, is_static_method, is_selfish, logical_xor, multi_parse,
+    numify, xor_constrain, PrettyMessage
 )
 
 
+class Base:
+    def __init__(self, a):
+        self.a = a
+        self.b = None
+
+
+class Derived(Base):
+    def __init__(self, a, c):
+        self.c = c
+        super().__init__(a)
+        self.d = None
+
+
+class Inherited(Derived):
+    pass
+
+
+class Explicit(Inherited):
+    def __init__(this, e):
+        this.e = (e,
+                  e)  # this.z = None
+        super(Explicit, this).__init__(e, e)
+        this.f, this.a = e, e
+
+
+class Bare:
+    pass
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ('idx', 'cls',         'check'),
+    [(0,     Base,         ['a', 'b']),
+     (1,     Derived,      ['c', 'a', 'b', 'd']),
+     (2,     Inherited,    ['c', 'a', 'b', 'd']),
+     (3,     Explicit,     ['e', 'c', 'a', 'b', 'd', 'f']),
+     (4,     Bare,         []),
+     ])
+def test_derive_attributes(idx, cls, check):
+    """Test derive attributes, including cached results"""
+    attributes = derive_attributes(cls)
+    assert attributes == check
+    cached_attributes = derive_attributes(cls)
+    assert cached_attributes == check
+    assert cached_attributes is not attributes
+
+
 FULL_URL = 'https://www.ncbi.nlm.nih.gov/pmc/articles/PMC5452388/'
 CHECK_DOMAIN = 'www.ncbi.nlm.nih.gov'
 
@@ -34,6 +85,7 @@ CHECK_DOMAIN = 'www.ncbi.nlm.nih.gov'
      (13,                               '/pmc/articles/PMC5452388/', '/pmc',       ValueError),
      (14,                               None,                        None,         ValueError),
      (15,                               '',                          None,         ValueError),
+     (16,   'www.ncbi.nlm.nih.gov/pmc?next=https://www.google.com',  None,         CHECK_DOMAIN),
      ])
 def test_derive_domain(idx, url, base, check):
     """Test derive domain under different scenarios"""
@@ -151,6 +203,53 @@ def test_get_related_json(idx, base, field, payload, strict, check):
             assert value == check
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ('idx', 'name',                 'is_class', 'is_module'),
+    [(0,    'Foo',                   True,       False),
+     (1,    'FooBar2',               True,       False),
+     (2,    'foo',                   False,      True),
+     (3,    'foo_bar2',              False,      True),
+     (4,    '__main__',              False,      True),
+     (5,    'foo_',                  False,      False),
+     (6,    'Foo\n',                 False,      False),
+     (7,    'foo.bar',               False,      False),
+     (8,    '',                      False,      False),
+     ])
+def test_is_class_or_module_name(idx, name, is_class, is_module):
+    assert is_class_name(name) is is_class
+    assert is_module_name(name) is is_module
+
+
+class LegacySequence:
+    """Iterable only via the __getitem__ protocol"""
+    def __getitem__(self, index):
+        if index < 2:
+            return index
+        raise IndexError(index)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ('idx', 'obj',                  'is_sequence', 'is_iterable'),
+    [(0,    [1, 2],                  True,          True),
+     (1,    (1, 2),                  True,          True),
+     (2,    range(2),                True,          True),
+     (3,    'ab',                    False,         False),
+     (4,    b'ab',                   False,         True),
+     (5,    {'a': 1},                False,         True),
+     (6,    {1, 2},                  False,         True),
+     (7,    iter([1, 2]),            False,         True),
+     (8,    list,                    False,         False),
+     (9,    42,                      False,         False),
+     (10,   None,                    False,         False),
+     (11,   LegacySequence(),        True,          True),
+     ])
+def test_is_nonstring_sequence_and_is_packed(idx, obj, is_sequence, is_iterable):
+    assert is_nonstring_sequence(obj) is is_sequence
+    assert is_packed(obj) is is_iterable
+
+
 def func():
     pass
 
@@ -193,6 +292,23 @@ class C(metaclass=M):
         return f'{self.__class__.__qualname__}()'
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ('idx', 'func',                'check'),
+    [
+     (0,     func,                  []),
+     (1,     func_params,           ['a', 'b']),
+     (2,     C.imethod_params,      ['a', 'b']),
+     (3,     C.cmethod_params,      ['a', 'b']),
+     (4,     C.smethod_params,      ['a', 'b']),
+     ])
+def test_derive_args(idx, func, check):
+    args = derive_args(func)
+    assert args == check
+    args.append('z')
+    assert derive_args(func) == check
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize(
     ('idx', 'func',        'check'),
@@ -309,3 +425,69 @@ def test_xor_constrain(idx, a, b, check):
             xor_constrain(a, b)
     else:
         assert xor_constrain(a, b) is check
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ('idx',  'text',     'default',  'check'),
+    [
+     (0,     '42',        object,     42),
+     (1,     '-42',       object,     -42),
+     (2,     '+42',       object,     42),
+     (3,     '0',         object,     0),
+     (4,     '00',        object,     0),
+     (5,     '007',       object,     SyntaxError),
+     (6,     '007',       None,       None),
+     (7,     '1_000',     object,     1000),
+     (8,     '4.5',       object,     4.5),
+     (9,     '-1e3',      object,     -1000.0),
+     (10,    '1.5j',      object,     1.5j),
+     (11,    '0x10',      object,     16),
+     (12,    '--5',       object,     ValueError),
+     (13,    '(1, 2)',    object,     (1, 2)),
+     (14,    'n',         object,     ValueError),
+     (15,    'n',         'n',        'n'),
+     (16,    '²',         object,     SyntaxError),
+     ])
+def test_numify(idx, text, default, check):
+    if is_child_class(check, Exception):
+        with pytest.raises(check):
+            numify(text, default)
+    else:
+        value = numify(text, default)
+        assert value == check
+        assert type(value) is type(check)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ('idx',  'templates',                      'text',          'check'),
+    [
+     (0,     ['{value:d} items'],               '42 items',      42),
+     (1,     ['{value:d} items', 'n={value}'],  'n=42',          '42'),
+     (2,     ('{value:d} items', 'n={value}'),  'n=42',          '42'),
+     (3,     ['{value:d} items', 'n={value}'],  '42',            ValueError),
+     ])
+def test_multi_parse(idx, templates, text, check):
+    if is_child_class(check, Exception):
+        with pytest.raises(check):
+            multi_parse(templates, text)
+    else:
+        for _ in range(2):  # second pass uses cached parsers
+            assert multi_parse(templates, text).named['value'] == check
+
+
+class Unformattable:
+    def __repr__(self):
+        raise AssertionError('Message formatted before emitted')
+
+
+@pytest.mark.unit
+def test_pretty_message(caplog):
+    """Test pretty message fields are only formatted when emitted"""
+    logger = logging.getLogger(__name__)
+    logger.setLevel(logging.INFO)
+    logger.debug(PrettyMessage(msg='Not emitted', obj=Unformattable()))
+
+    logger.info(PrettyMessage(msg='Emitted', type='emitted', values=[1, 2]))
+    assert caplog.messages == ["{'msg': 'Emitted', 'type': 'emitted', 'values': [1, 2]}"]
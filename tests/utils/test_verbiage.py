@@ -3,8 +3,8 @@
 import pytest
 from itertools import permutations
 
-from contextualize.utils.tools import numify
-from contextualize.utils.verbiage import Plurality, a, an
+from contextualize.utils.tools import is_child_class, numify
+from contextualize.utils.verbiage import ClearTemplate, Plurality, a, an
 
 
 @pytest.mark.unit
@@ -42,6 +42,9 @@ from contextualize.utils.verbiage import Plurality, a, an
      ('a',      'whale'),
      ('a',      'xeme'),  # missing from cmudict
      ('an',     'x-ray tetra'),
+     ('an',     '(X-ray) tetra'),
+     ('an',     '"honest" angler'),
+     ('a',      'U.S.-based aquarium'),
      ('a',      'yak'),
      ('a',      'zebra'),
      ('a',      '0-headed hydra'),
@@ -173,6 +176,46 @@ def test_indefinite_article(article, phrase):
     assert articled2 == check
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ('idx', 'template',             'mapping',                              'check'),
+    [
+     (0,    '$n $things',           dict(n=2, thing='ox', things='oxen'),   '2 oxen'),
+     (1,    '$a $thing',            dict(n=1, thing='ox', things='oxen'),   '$a ox'),
+     (2,    '$n $things',           dict(n=2, thing='ox'),                  '2 $things'),
+     (3,    '$$n costs ${n}',       dict(n=2),                              '$n costs 2'),
+     (4,    '$thingy $thing',       dict(thing='ox'),                       '$thingy ox'),
+     (5,    '$thing and $things',   dict(thing='$things', things='oxen'),   '$things and oxen'),
+     ])
+def test_clear_template_fast_substitute(idx, template, mapping, check):
+    """Test fast substitution matches safe substitution"""
+    clear_template = ClearTemplate(template)
+    assert clear_template.fast_substitute(mapping) == check
+    assert clear_template.safe_substitute(mapping) == check
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ('idx', 'template',                 'check'),
+    [
+     (0,    'no articles here',         'no articles here'),
+     (1,    '$a ox',                    'an ox'),
+     (2,    'one $a cow',               'one a cow'),
+     (3,    '$a ox and $a cow',         'an ox and a cow'),
+     (4,    'not$a token',              'not$a token'),
+     (5,    '$a',                       ValueError),
+     (6,    'dangling $a',              ValueError),
+     ])
+def test_render_articles(idx, template, check):
+    """Test rendering article tokens in templates"""
+    plurality = Plurality(1, 'ox/en')
+    if is_child_class(check, Exception):
+        with pytest.raises(check):
+            plurality._render_articles(template)
+    else:
+        assert plurality._render_articles(template) == check
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize(
     ('idx', 'forms',                'article',  'thing',            'things'),
@@ -184,6 +227,7 @@ def test_indefinite_article(article, phrase):
      (4,    'unicorn/s',            'a',        'unicorn',          'unicorns'),
      (5,    "R.O.U.S./'s",          'an',       'R.O.U.S.',         "R.O.U.S.'s"),
      (6,    '11-headed hydra/s',    'an',       '11-headed hydra',  '11-headed hydras'),
+     (7,    '/x/y',                 'an',       'x',                'y'),
      ])
 @pytest.mark.parametrize(
     'number',
@@ -351,3 +395,16 @@ def validate_thing_in_partial_str(thing, thing_token, article, template_str, plu
         assert thing in plurality_str
         # if thing and $a template and number == 1, it's not partial
         assert article_token not in template_str
+
+
+@pytest.mark.unit
+def test_template_cache_reset_on_reconfiguration():
+    """Test cached template is reset when number or templates change"""
+    plurality = Plurality(1, 'ox/en')
+    assert str(plurality) == '1 ox'
+    plurality._configure_templates('1=$a $thing')
+    assert str(plurality) == 'an ox'
+    plurality._configure_number(2, override=True)
+    assert str(plurality) == '2 oxen'
+    assert plurality.get_template(1).template == '$a $thing'
+    assert str(Plurality(1, 'ox/en')) == '1 ox'  # defaults remain intact
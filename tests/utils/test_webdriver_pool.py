@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from unittest.mock import Mock
+
+import pytest
+
+from contextualize.utils.webdriver_pool import WebDriverPool
+
+
+class ChromeDriver:
+
+    def __init__(self):
+        self.delete_all_cookies = Mock()
+        self.get = Mock()
+        self.last_fetch_timestamp = 'set by fetch'
+
+
+class FirefoxDriver(ChromeDriver):
+    pass
+
+
+class Provisioner:
+
+    async def provision(self, web_driver_type, loop=None):
+        web_driver = web_driver_type()
+        self.provisioned.append(web_driver)
+        return web_driver
+
+    async def deprovision(self, web_driver, loop=None):
+        self.deprovisioned.append(web_driver)
+
+    def __init__(self):
+        self.provisioned = []
+        self.deprovisioned = []
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'idx, maxsize, checkouts, provisioned_check, idle_check, deprovisioned_check',
+    [(0,  4,       [ChromeDriver],                          1,  1,  0),
+     (1,  4,       [ChromeDriver, ChromeDriver],            2,  2,  0),
+     (2,  1,       [ChromeDriver, ChromeDriver],            2,  1,  1),
+     (3,  0,       [ChromeDriver, ChromeDriver],            2,  0,  2),
+     (4,  1,       [ChromeDriver, FirefoxDriver],           2,  2,  0),
+     ])
+@pytest.mark.asyncio
+async def test_web_driver_pool_checkout_checkin(idx, maxsize, checkouts, provisioned_check,
+                                                idle_check, deprovisioned_check):
+    """Test web driver pool checks in drivers for reuse up to maxsize"""
+    provisioner = Provisioner()
+    pool = WebDriverPool(provision=provisioner.provision,
+                         deprovision=provisioner.deprovision,
+                         maxsize=maxsize)
+
+    web_drivers = [await pool.checkout(web_driver_type) for web_driver_type in checkouts]
+    for web_driver in web_drivers:
+        await pool.checkin(web_driver)
+
+    assert len(provisioner.provisioned) == provisioned_check
+    assert len(pool) == idle_check
+    assert len(provisioner.deprovisioned) == deprovisioned_check
+
+    # Idle web drivers are reset and reused before any are provisioned
+    for web_driver_type in checkouts[:idle_check]:
+        web_driver = await pool.checkout(web_driver_type)
+        assert web_driver in web_drivers
+        assert isinstance(web_driver, web_driver_type)
+        web_driver.delete_all_cookies.assert_called_once_with()
+        web_driver.get.assert_called_once_with(WebDriverPool.BLANK_URL)
+        assert web_driver.last_fetch_timestamp is None
+
+    assert len(provisioner.provisioned) == provisioned_check
+    assert len(pool) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_web_driver_pool_acquire_and_close():
+    """Test web driver pool acquire context manager and close"""
+    provisioner = Provisioner()
+    pool = WebDriverPool(provision=provisioner.provision,
+                         deprovision=provisioner.deprovision)
+
+    async with pool.acquire(ChromeDriver) as web_driver:
+        assert len(pool) == 0
+
+    assert len(pool) == 1
+
+    async with pool.acquire(ChromeDriver) as reused_web_driver:
+        assert reused_web_driver is web_driver
+
+    await pool.close()
+    assert len(pool) == 0
+    assert provisioner.deprovisioned == [web_driver]
+
+    # Web drivers that fail to reset are deprovisioned rather than reused
+    broken_web_driver = await pool.checkout(ChromeDriver)
+    broken_web_driver.delete_all_cookies.side_effect = RuntimeError('Web driver is gone')
+    await pool.checkin(broken_web_driver)
+    assert len(pool) == 0
+    assert provisioner.deprovisioned == [web_driver, broken_web_driver]
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import os
 from collections import namedtuple
 from urllib.parse import urljoin
 
@@ -7,10 +8,14 @@ import aiohttp
 import pytest
 
 from settings import TEST_WEB_SERVER_BASE_URL
+from tests.fixtures import TEST_WEB_SERVER_BASE_PATH
 
 TEST_RELATIVE_URL = 'hello_world.html'
 TEST_URL = urljoin(TEST_WEB_SERVER_BASE_URL, TEST_RELATIVE_URL)
 
+TEST_LARGE_RELATIVE_URL = 'useragents/useragents.min.css'
+TEST_LARGE_URL = urljoin(TEST_WEB_SERVER_BASE_URL, TEST_LARGE_RELATIVE_URL)
+
 Response = namedtuple('Response', 'text status')
 
 
@@ -35,3 +40,14 @@ async def test_web_server_via_web_client_fixture(web_server, web_client_session)
     response = await fetch(TEST_URL, web_client_session)
     assert response.text.strip() == 'Hello World!'
     assert response.status == 200
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_web_server_large_file(web_server, web_client_session):
+    file_path = os.path.join(os.getcwd() + TEST_WEB_SERVER_BASE_PATH, TEST_LARGE_RELATIVE_URL)
+    with open(file_path) as file:
+        content = file.read()
+    response = await fetch(TEST_LARGE_URL, web_client_session)
+    assert response.text == content
+    assert response.status == 200